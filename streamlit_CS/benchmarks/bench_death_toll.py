@@ -0,0 +1,57 @@
+"""Benchmark and equivalence check: parse_death_toll_column vs parse_death_toll.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_death_toll.py [rows]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from data.DataEDA import SOURCE_PATH, parse_death_toll, parse_death_toll_column
+
+
+def check_equivalent(values):
+    expected = values.apply(parse_death_toll).astype(float)
+    actual = parse_death_toll_column(values)
+    pd.testing.assert_series_equal(actual, expected, check_names=False)
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    column = pd.read_csv(SOURCE_PATH)["Death toll (estimate)"]
+
+    # Equivalence on the real column plus the edge cases the scalar parser handles
+    check_equivalent(column)
+    check_equivalent(pd.Series([np.nan, "Unknown", "n/a", "1.2.3", "...", "25,000+",
+                                "15–100 million", "3 thousand", " 5 Billion ", "none", 12.0]))
+    print(f"Equivalent on {len(column)} CSV rows and edge cases.")
+
+    rng = np.random.default_rng(0)
+    sampled = pd.Series(rng.choice(column.to_numpy(), size=n_rows))
+    # Worst case for factorizing: every string distinct. The suffix is
+    # letters only, so it never adds a number, unit or unknown marker.
+    n_distinct = n_rows // 5
+    letters = str.maketrans("0123456789", "abcdefghij")
+    suffixes = [str(i).translate(letters) for i in range(n_distinct)]
+    distinct = pd.Series(rng.choice(column.dropna().to_numpy(), size=n_distinct)) + " ~" + pd.Series(suffixes)
+
+    for label, values in (("sampled", sampled), ("all distinct", distinct)):
+        start = time.perf_counter()
+        expected = values.apply(parse_death_toll).astype(float)
+        scalar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = parse_death_toll_column(values)
+        column_s = time.perf_counter() - start
+
+        pd.testing.assert_series_equal(actual, expected, check_names=False)
+        print(f"{label}: {len(values):,} rows ({values.nunique():,} distinct): apply {scalar_s:.2f}s, "
+              f"column {column_s:.2f}s ({scalar_s / column_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark: stored-history reads from N viewers, direct store queries vs utils.fetch_cache.
+
+Fills a temporary TimeSeriesStore with 30 days of two coin prices at the
+CoinGecko page's 30 s poll interval. N viewer threads then read the
+"last 30 days" chart once per tick for a few seconds, while a poller
+thread appends a price every POLL_SEC and invalidates the cached query,
+as the live pages do. Reports store queries run and read latency.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_fetch_cache.py [viewers] [seconds]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from utils.fetch_cache import FetchCache
+from utils.timeseries_store import TimeSeriesStore
+
+COINS = ["bitcoin", "ethereum"]
+TICK_SEC = 0.2
+POLL_SEC = 1.0
+WINDOW = pd.Timedelta(days=30)
+
+
+def fill(store):
+    end = pd.Timestamp.now(tz="UTC")
+    times = pd.date_range(end - WINDOW, end, freq="30s")
+    rng = np.random.default_rng(0)
+    with store._connect() as conn:
+        for coin, start in zip(COINS, (68000, 3500)):
+            prices = start * np.exp(np.cumsum(rng.normal(0, 0.001, len(times))))
+            conn.executemany(
+                "INSERT OR IGNORE INTO readings VALUES (?, ?, ?, ?)",
+                [("coingecko", coin, t.timestamp(), float(p)) for t, p in zip(times, prices)],
+            )
+    return len(times) * len(COINS)
+
+
+def simulate(viewers, seconds, store, read):
+    stop = time.perf_counter() + seconds
+    latencies = []
+    on_append = getattr(read, "invalidate", lambda: None)
+
+    def viewer():
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            read()
+            latencies.append(time.perf_counter() - start)
+            time.sleep(TICK_SEC)
+
+    def poller():
+        while time.perf_counter() < stop:
+            time.sleep(POLL_SEC)
+            store.append("coingecko", pd.Timestamp.now(tz="UTC"), {"bitcoin": 68000.0, "ethereum": 3500.0})
+            on_append()
+
+    threads = [threading.Thread(target=viewer) for _ in range(viewers)] + [threading.Thread(target=poller)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.array(latencies) * 1000
+
+
+def main():
+    viewers = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TimeSeriesStore(os.path.join(tmp, "history.sqlite3"))
+        print(f"{fill(store):,} stored prices, {viewers} viewers reading every {TICK_SEC}s, "
+              f"a new price every {POLL_SEC}s, {seconds:.0f}s per run")
+        print(f"{'mode':<8}  {'reads':>6}  {'queries':>7}  {'p50 ms':>7}  {'p99 ms':>7}")
+
+        queries = [0]
+
+        def query():
+            queries[0] += 1
+            end = pd.Timestamp.now(tz="UTC")
+            return store.query("coingecko", COINS, end - WINDOW, end, points=800)
+
+        cache = FetchCache()
+
+        def cached():
+            return cache.get(("coingecko history", ("Last 30 days",)), query, ttl=30)
+
+        cached.invalidate = lambda: cache.invalidate("coingecko history")
+
+        for mode, read in (("direct", query), ("cached", cached)):
+            queries[0] = 0
+            latencies = simulate(viewers, seconds, store, read)
+            print(f"{mode:<8}  {len(latencies):>6}  {queries[0]:>7}  "
+                  f"{np.percentile(latencies, 50):>7.2f}  {np.percentile(latencies, 99):>7.2f}")
+        print(cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark: indexed LocationResolver vs the original linear-scan get_coords.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_geocode.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from data.DataEDA import SOURCE_PATH, LocationResolver, coords_map
+
+
+# The pre-index implementation, kept here as the baseline
+def legacy_get_coords(location):
+    if location in coords_map:
+        return coords_map[location]
+    for key, val in coords_map.items():
+        if key.lower() in location.lower():
+            return val
+    return (0, 0)
+
+
+def make_events(n_rows, n_locations, seed=0):
+    """Enlarge the real Location column with suffixed variants (unique places)."""
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(SOURCE_PATH)["Location"].dropna().unique()
+    variants = [f"Site {i}, {base[i % len(base)]}" for i in range(n_locations)]
+    pool = np.concatenate([base, variants])
+    return pd.Series(rng.choice(pool, size=n_rows))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'rows':>9} {'distinct':>9} {'legacy (s)':>11} {'indexed (s)':>12} {'speedup':>8}")
+    for n_rows, n_locations in [(10_000, 500), (50_000, 2_000), (200_000, 5_000)]:
+        locations = make_events(n_rows, n_locations)
+        _, legacy_s = timed(lambda: locations.apply(legacy_get_coords))
+        # Fresh resolver each run so index build and cold cache are included
+        _, indexed_s = timed(lambda: LocationResolver(coords_map).resolve_series(locations))
+        print(f"{n_rows:>9,} {locations.nunique():>9,} {legacy_s:>11.3f} {indexed_s:>12.3f} "
+              f"{legacy_s / indexed_s:>7.1f}x")
+
+    # Show where the longest-match rule picks a different key than dict order did
+    real = pd.read_csv(SOURCE_PATH)["Location"].dropna().unique()
+    resolver = LocationResolver(coords_map)
+    changed = [
+        (loc, legacy_get_coords(loc), resolver.resolve(loc)[:2])
+        for loc in real
+        if tuple(map(float, legacy_get_coords(loc))) != resolver.resolve(loc)[:2]
+    ]
+    print(f"\n{len(changed)} of {len(real)} real locations resolve differently:")
+    for loc, old, new in changed:
+        print(f"  {loc}: {old} -> {new}")
+
+
+if __name__ == "__main__":
+    main()
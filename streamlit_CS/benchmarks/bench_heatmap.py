@@ -0,0 +1,56 @@
+"""Benchmark: heatmap payload, raw points vs server-side hexagon bins.
+
+Enlarges the processed table to N rows (jittered coordinates, one
+disease) and builds the heatmap data both ways at the Dashboard's zoom
+levels. Reports build time, number of heatmap points and JSON size.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_heatmap.py [sizes...]
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from data.DataEDA import PROCESSED_PATH, load_processed
+from utils.pandemic_data import DiseaseSummary
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+ZOOMS = [2, 3]
+
+
+def enlarge(df, n, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = df.iloc[rng.integers(0, len(df), n)].reset_index(drop=True)
+    rows["Latitude"] = (rows["Latitude"] + rng.normal(0, 5, n)).clip(-80, 80).astype("float32")
+    rows["Longitude"] = (rows["Longitude"] + rng.normal(0, 5, n)).clip(-180, 180).astype("float32")
+    return rows
+
+
+def timed(fn):
+    start = time.perf_counter()
+    points = fn()
+    return time.perf_counter() - start, len(points), len(json.dumps(points))
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    df = load_processed(PROCESSED_PATH)
+    print(f"{'events':>8}  {'method':<16}  {'build s':>8}  {'points':>8}  {'JSON KB':>8}")
+    for n in sizes:
+        rows = enlarge(df, n)
+        summary = DiseaseSummary(rows)
+        seconds, points, size = timed(lambda: rows[["Latitude", "Longitude"]].values.tolist())
+        print(f"{n:>8}  {'raw':<16}  {seconds:>8.3f}  {points:>8}  {size / 1024:>8.0f}")
+        for zoom in ZOOMS:
+            for weighted in (False, True):
+                name = f"hex z{zoom}" + (" deaths" if weighted else "")
+                seconds, points, size = timed(lambda: summary.heat_cells(zoom, weighted))
+                print(f"{n:>8}  {name:<16}  {seconds:>8.3f}  {points:>8}  {size / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
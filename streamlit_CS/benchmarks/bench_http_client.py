@@ -0,0 +1,88 @@
+"""Benchmark: bare requests.get() vs the shared utils.http_client.HttpClient, against a local stub.
+
+- keep-alive: sequential fetches, connections opened and time per fetch
+- retries: a 429 with Retry-After and a run of 503s before a 200
+- concurrency: many threads fetching a slow endpoint, peak requests in flight
+
+Each part asserts what HttpClient promises (one connection, the expected
+status and attempt count, no more than the cap in flight), so a
+regression fails the script instead of only printing different numbers.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_http_client.py [fetches]
+"""
+import os
+import sys
+import threading
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from stub_server import StubServer
+from utils.http_client import HttpClient
+
+PAYLOAD = {"bitcoin": {"usd": 68000}, "ethereum": {"usd": 3500}}
+
+
+def keep_alive(server, fetches):
+    print(f"{'client':<12}  {'fetches':>7}  {'connections':>11}  {'ms/fetch':>8}")
+    for name, get, connections in (("requests.get", requests.get, fetches), ("HttpClient", HttpClient().get, 1)):
+        server.reset()
+        start = time.perf_counter()
+        for _ in range(fetches):
+            get(server.url("/simple/price"), timeout=10).raise_for_status()
+        elapsed = (time.perf_counter() - start) * 1000 / fetches
+        print(f"{name:<12}  {fetches:>7}  {server.connections:>11}  {elapsed:>8.2f}")
+        assert server.connections == connections, f"{name}: {server.connections} connections, expected {connections}"
+
+
+def retries(server):
+    client = HttpClient(backoff=0.1)
+    print(f"\n{'scenario':<26}  {'status':>6}  {'attempts':>8}  {'seconds':>7}")
+    # (scenario, queued responses, expected status, expected attempts, (min, max) seconds)
+    for name, script, status, attempts, (fastest, slowest) in (
+        ("429, Retry-After: 1", [(429, {"Retry-After": "1"})], 200, 2, (1, 5)),
+        ("503 x3 (jittered backoff)", [(503, {})] * 3, 200, 4, (0, 5)),
+        ("429, Retry-After: 120", [(429, {"Retry-After": "120"})], 429, 1, (0, 1)),
+        ("503 x5 (gives up)", [(503, {})] * 5, 503, 4, (0, 5)),
+    ):
+        server.reset()
+        for queued_status, headers in script:
+            server.queue(queued_status, headers)
+        start = time.perf_counter()
+        resp = client.get(server.url("/simple/price"))
+        elapsed = time.perf_counter() - start
+        print(f"{name:<26}  {resp.status_code:>6}  {server.requests:>8}  {elapsed:>7.2f}")
+        assert resp.status_code == status, f"{name}: status {resp.status_code}, expected {status}"
+        assert server.requests == attempts, f"{name}: {server.requests} attempts, expected {attempts}"
+        assert fastest <= elapsed < slowest, f"{name}: took {elapsed:.2f}s, expected {fastest}-{slowest}s"
+
+
+def concurrency(server, threads=32, cap=4):
+    print(f"\n{threads} threads, 100 ms per response")
+    print(f"{'client':<22}  {'peak in flight':>14}  {'seconds':>7}")
+    for name, get in (("requests.get", requests.get), (f"HttpClient (cap {cap})", HttpClient(max_concurrent=cap).get)):
+        server.reset()
+        workers = [threading.Thread(target=get, args=(server.url("/simple/price"),)) for _ in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        print(f"{name:<22}  {server.peak_in_flight:>14}  {time.perf_counter() - start:>7.2f}")
+        assert server.requests == threads, f"{name}: {server.requests} requests, expected {threads}"
+    assert server.peak_in_flight <= cap, f"HttpClient: {server.peak_in_flight} in flight, cap is {cap}"
+
+
+def main():
+    fetches = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with StubServer(PAYLOAD) as server:
+        keep_alive(server, fetches)
+        retries(server)
+    with StubServer(PAYLOAD, delay=0.1) as server:
+        concurrency(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: building the Dashboard's marker layer, per-row Markers vs clustered bulk markers.
+
+Enlarges the processed table to N rows by sampling with jittered
+coordinates, then builds the pandemic FeatureGroup both ways and renders
+its Leaflet script the way st_folium does. Reports build time and the
+size of the generated script.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_markers.py [sizes...]
+"""
+import os
+import sys
+import time
+
+import folium
+import numpy as np
+from streamlit_folium import generate_leaflet_string
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from data.DataEDA import PROCESSED_PATH, load_processed
+from utils.geo_layers import event_markers
+
+DEFAULT_SIZES = [100, 10_000, 100_000]
+# The per-row path takes minutes past this; it is skipped for bigger sizes
+PER_ROW_LIMIT = 10_000
+
+
+def enlarge(df, n, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = df.iloc[rng.integers(0, len(df), n)].reset_index(drop=True)
+    rows["Latitude"] = rows["Latitude"] + rng.normal(0, 2, n).astype("float32")
+    rows["Longitude"] = rows["Longitude"] + rng.normal(0, 2, n).astype("float32")
+    return rows
+
+
+def per_row(rows):
+    """The loop render_data used before: one Marker, Icon and popup per row."""
+    layer = folium.FeatureGroup(name="pandemic")
+    for _, row in rows.iterrows():
+        popup_html = f"""
+        <div style="min-width: 200px;">
+            <b>Location:</b> {row['Location']}<br>
+            <b>Time:</b> {row['Date']}<br>
+            <b>Deaths:</b> {row['Death toll (estimate)']}
+        </div>
+        """
+        folium.Marker(
+            location=[row["Latitude"], row["Longitude"]],
+            popup=popup_html,
+            tooltip=row['Location'],
+            icon=folium.Icon(color="red", icon="info-sign"),
+        ).add_to(layer)
+    return layer
+
+
+def bulk(rows):
+    layer = folium.FeatureGroup(name="pandemic")
+    event_markers(rows).add_to(layer)
+    return layer
+
+
+def measure(build, rows):
+    start = time.perf_counter()
+    layer = build(rows)
+    # st_folium attaches the group to the map and renders its script
+    m = folium.Map()
+    layer.add_to(m)
+    layer.render()
+    script = generate_leaflet_string(layer)
+    return time.perf_counter() - start, len(script.encode())
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    df = load_processed(PROCESSED_PATH)
+    print(f"{'markers':>8}  {'method':<8}  {'build s':>8}  {'script KB':>10}")
+    for n in sizes:
+        rows = enlarge(df, n)
+        for name, build in (("per-row", per_row), ("bulk", bulk)):
+            if build is per_row and n > PER_ROW_LIMIT:
+                print(f"{n:>8}  {name:<8}  {'skipped':>8}")
+                continue
+            seconds, size = measure(build, rows)
+            print(f"{n:>8}  {name:<8}  {seconds:>8.2f}  {size / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
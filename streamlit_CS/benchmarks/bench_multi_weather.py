@@ -0,0 +1,69 @@
+"""Benchmark: refreshing current weather for many sites, one request per site vs utils.weather batches.
+
+A local stub server (stub_server.py) answers like Open-Meteo: one result
+per comma-separated coordinate pair, after a fixed delay standing in for
+network latency. For each site count it reports upstream requests and
+refresh time:
+
+- per site: one request per location, in turn (the old page, times N)
+- batched: MAX_BATCH coordinates per request, batches in turn
+- concurrent: the same batches, MAX_CONCURRENT at a time (fetch_current)
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_multi_weather.py [delay_ms]
+"""
+import os
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from stub_server import StubServer
+from utils import weather
+from utils.http_client import HttpClient
+from utils.weather import MAX_BATCH, MAX_CONCURRENT, fetch_current
+
+SITE_COUNTS = (1, 32, 400)
+PER_SITE_LIMIT = 40  # beyond this the per-site run only repeats the same line, slower
+
+
+def open_meteo(path):
+    query = parse_qs(urlsplit(path).query)
+    lats = query["latitude"][0].split(",")
+    results = [
+        {"latitude": float(lat), "current": {"time": "2026-01-01T12:00", "temperature_2m": 10.0, "wind_speed_10m": 5.0}}
+        for lat in lats
+    ]
+    return results[0] if len(results) == 1 else results
+
+
+def sites(n):
+    return {f"site {i}": (37 + (i % 40) * 0.1, -109 + (i // 40) * 0.1) for i in range(n)}
+
+
+def run(server, label, fetch):
+    server.reset()
+    start = time.perf_counter()
+    df, err = fetch()
+    elapsed = time.perf_counter() - start
+    assert err is None, err
+    return f"{label:<12}  {len(df):>5}  {server.requests:>8}  {elapsed:>7.2f}"
+
+
+def main():
+    delay = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.2
+    client = HttpClient()
+    with StubServer(open_meteo, delay=delay) as server:
+        weather.FORECAST_URL = server.url("/v1/forecast")
+        print(f"{delay * 1000:.0f} ms per upstream response, MAX_BATCH {MAX_BATCH}, MAX_CONCURRENT {MAX_CONCURRENT}")
+        print(f"{'mode':<12}  {'sites':>5}  {'requests':>8}  {'seconds':>7}")
+        for n in SITE_COUNTS:
+            locations = sites(n)
+            if n <= PER_SITE_LIMIT:
+                print(run(server, "per site", lambda: fetch_current(locations, client, batch_size=1, max_concurrent=1)))
+            print(run(server, "batched", lambda: fetch_current(locations, client, max_concurrent=1)))
+            print(run(server, "concurrent", lambda: fetch_current(locations, client)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark: upstream requests from N viewers, per-session fetches vs one shared Poller.
+
+Serves a CoinGecko-shaped JSON response from the local stub server in
+stub_server.py, which counts requests. N viewer threads each "refresh"
+once per tick for a few seconds, either fetching for themselves (what
+clearing the shared cache on every auto-refresh amounted to) or reading
+the latest snapshot of a single utils.poller.Poller. Per-session runs
+must cost one request per read; poller runs at most one per POLL_SEC
+(plus the first fetch and one in flight at the end) whatever the number
+of viewers, or the script fails.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_poller.py [viewers] [seconds]
+"""
+import os
+import sys
+import threading
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from stub_server import StubServer
+from utils.poller import Poller
+
+TICK_SEC = 0.5
+POLL_SEC = 1.0
+PAYLOAD = {"bitcoin": {"usd": 68000}, "ethereum": {"usd": 3500}}
+
+
+def fetch(url):
+    try:
+        resp = requests.get(url, timeout=10)
+        resp.raise_for_status()
+        return resp.json(), None
+    except requests.RequestException as e:
+        return None, str(e)
+
+
+def simulate(viewers, seconds, read):
+    stop = time.perf_counter() + seconds
+    reads = []
+
+    def viewer():
+        count = 0
+        while time.perf_counter() < stop:
+            if read() is not None:
+                count += 1
+            time.sleep(TICK_SEC)
+        reads.append(count)
+
+    threads = [threading.Thread(target=viewer) for _ in range(viewers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(reads)
+
+
+def main():
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    viewer_counts = [int(sys.argv[1])] if len(sys.argv) > 1 else [1, 10, 50]
+
+    with StubServer(PAYLOAD) as server:
+        url = server.url("/simple/price")
+        print(f"tick {TICK_SEC}s per viewer, poll every {POLL_SEC}s, {seconds:.0f}s per run")
+        print(f"{'viewers':>7}  {'mode':<12}  {'reads':>6}  {'upstream requests':>17}")
+        for viewers in viewer_counts:
+            for mode in ("per-session", "poller"):
+                server.reset()
+                if mode == "per-session":
+                    reads = simulate(viewers, seconds, lambda: fetch(url)[0])
+                    print(f"{viewers:>7}  {mode:<12}  {reads:>6}  {server.requests:>17}")
+                    assert server.requests == reads, f"{mode}: {server.requests} requests for {reads} reads"
+                else:
+                    poller = Poller(lambda: fetch(url), POLL_SEC)
+                    reads = simulate(viewers, seconds, lambda: poller.latest(wait=5).data)
+                    poller.stop()
+                    print(f"{viewers:>7}  {mode:<12}  {reads:>6}  {server.requests:>17}")
+                    limit = int(seconds / POLL_SEC) + 2
+                    assert server.requests <= limit, f"{mode}: {server.requests} requests, at most {limit} expected"
+                assert reads > 0, f"{mode}: no successful reads"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark: server threads held by auto-refresh, sleep + st.rerun() vs fragment run_every.
+
+Starts N simulated viewers (AppTest sessions: a driver thread plus the
+script thread for each) with auto-refresh on and samples the process's
+live thread count for a few seconds. "Held at end" counts the threads
+still alive once every first render should be done. The old pattern keeps every viewer's script thread asleep until
+the next tick; with a fragment the script returns at once and the
+browser schedules the ticks, so nothing is held in between.
+
+Scenarios run in separate interpreters so leftover sleeping threads do
+not leak into the next one. The two reference scripts mirror the live
+pages without the network call; the live pages themselves are run too
+(they fall back to sample data when offline), writing their history to a
+temporary store instead of the app's data/live file.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_refresh_threads.py [viewers] [seconds]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SLEEP_RERUN = """
+import time
+import streamlit as st
+
+refresh_sec = st.slider("Refresh every (sec)", 10, 300, 60, key="refresh_sec")
+auto_refresh = st.checkbox("Enable auto-refresh", value=False, key="auto_refresh")
+st.caption(f"Last refreshed at: {time.strftime('%H:%M:%S')}")
+st.write({"price": 68000})
+
+if auto_refresh:
+    time.sleep(refresh_sec)
+    st.cache_data.clear()
+    st.rerun()
+"""
+
+FRAGMENT = """
+import time
+import streamlit as st
+
+refresh_sec = st.slider("Refresh every (sec)", 10, 300, 60, key="refresh_sec")
+auto_refresh = st.checkbox("Enable auto-refresh", value=False, key="auto_refresh")
+
+@st.fragment(run_every=refresh_sec if auto_refresh else None)
+def live_view():
+    st.caption(f"Last refreshed at: {time.strftime('%H:%M:%S')}")
+    st.write({"price": 68000})
+
+live_view()
+"""
+
+CHILD = """
+import json, os, sys, threading, time
+import logging
+logging.disable(logging.CRITICAL)
+from streamlit.testing.v1 import AppTest
+
+script, viewers, seconds = sys.argv[1], int(sys.argv[2]), float(sys.argv[3])
+baseline = threading.active_count()
+finished = []
+
+def viewer():
+    at = AppTest.from_file(script, default_timeout=seconds + 5)
+    at.session_state["auto_refresh"] = True
+    at.session_state["refresh_sec"] = 30
+    try:
+        at.run()
+        finished.append(not at.exception)
+    except Exception:
+        pass
+
+for _ in range(viewers):
+    threading.Thread(target=viewer, daemon=True).start()
+
+peak = 0
+deadline = time.perf_counter() + seconds
+while time.perf_counter() < deadline:
+    peak = max(peak, threading.active_count() - baseline)
+    time.sleep(0.1)
+print(json.dumps({"peak": peak, "held": threading.active_count() - baseline, "finished": sum(finished)}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+
+def run(script, viewers, seconds, store_path):
+    env = dict(os.environ, PYTHONPATH=ROOT, LIVE_HISTORY_PATH=store_path)
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, script, str(viewers), str(seconds)],
+        capture_output=True, text=True, check=True, cwd=ROOT, env=env,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    viewers = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        scenarios = []
+        for name, source in (("sleep + rerun", SLEEP_RERUN), ("fragment", FRAGMENT)):
+            path = os.path.join(tmp, name.replace(" ", "_").replace("+", "") + ".py")
+            with open(path, "w") as f:
+                f.write(textwrap.dedent(source))
+            scenarios.append((name, path))
+        scenarios += [
+            ("4_LiveAPI.py", os.path.join(ROOT, "pages", "4_LiveAPI.py")),
+            ("5_CoinGecko.py", os.path.join(ROOT, "pages", "5_CoinGecko.py")),
+        ]
+
+        print(f"{viewers} viewers, auto-refresh every 30 s, sampled for {seconds:.0f} s")
+        print(f"{'script':<16}  {'peak threads':>12}  {'held at end':>11}  {'clean runs':>10}")
+        for name, path in scenarios:
+            result = run(path, viewers, seconds, os.path.join(tmp, "live_history.sqlite3"))
+            print(f"{name:<16}  {result['peak']:>12}  {result['held']:>11}  {result['finished']:>10}")
+
+
+if __name__ == "__main__":
+    main()
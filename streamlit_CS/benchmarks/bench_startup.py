@@ -0,0 +1,91 @@
+"""Benchmark: cold start of each page, in a fresh interpreter per page.
+
+For every page this reports the time to import streamlit itself, the
+first render of the page (its own imports included, as on a new server
+process), a second, warm render, and which heavy libraries ended up
+loaded. Dashboard views other than Home are reached through session
+state, the way its sidebar buttons do.
+
+Pages that call external APIs fall back to sample data when offline, so
+their numbers include whatever the network does. The live pages write
+their history to a temporary store, not the app's data/live file. A page whose libraries
+are not installed shows up with an error count.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_startup.py [label...]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# (label, script, session state to set before the first render)
+TARGETS = [
+    ("app", "app.py", {}),
+    ("Bio", "pages/1_Bio.py", {}),
+    ("Visualization", "pages/2_Visualization.py", {}),
+    ("Pie", "pages/3_Pie.py", {}),
+    ("LiveAPI", "pages/4_LiveAPI.py", {}),
+    ("CoinGecko", "pages/5_CoinGecko.py", {}),
+    ("Dashboard/Home", "pages/6_Dashboard.py", {}),
+    ("Dashboard/Data", "pages/6_Dashboard.py", {"page": "Data"}),
+    ("Dashboard/About", "pages/6_Dashboard.py", {"page": "About Me"}),
+    ("NodeGraph", "pages/7_NodeGraph.py", {}),
+]
+
+HEAVY_MODULES = ["pandas", "plotly", "folium", "streamlit_folium", "geopandas", "matplotlib", "networkx", "pyarrow"]
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+import_s = time.perf_counter() - start
+
+heavy = json.loads(sys.argv[3])
+before = {name for name in heavy if name in sys.modules}
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+for key, value in json.loads(sys.argv[2]).items():
+    at.session_state[key] = value
+start = time.perf_counter()
+at.run()
+first_s = time.perf_counter() - start
+start = time.perf_counter()
+at.run()
+warm_s = time.perf_counter() - start
+loaded = [name for name in heavy if name in sys.modules and name not in before]
+print(json.dumps({"import": import_s, "first": first_s, "warm": warm_s,
+                  "errors": len(at.exception), "loaded": loaded}))
+"""
+
+
+def run(script, state, store_path):
+    env = dict(os.environ, PYTHONPATH=ROOT, LIVE_HISTORY_PATH=store_path)
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, os.path.join(ROOT, script), json.dumps(state), json.dumps(HEAVY_MODULES)],
+        capture_output=True, text=True, check=True, cwd=ROOT, env=env,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    wanted = set(sys.argv[1:])
+    print(f"{'page':<16}  {'st import s':>11}  {'first s':>8}  {'warm s':>7}  loaded")
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = os.path.join(tmp, "live_history.sqlite3")
+        for label, script, state in TARGETS:
+            if wanted and label not in wanted:
+                continue
+            result = run(script, state, store_path)
+            errors = f"  ({result['errors']} errors)" if result["errors"] else ""
+            print(
+                f"{label:<16}  {result['import']:>11.2f}  {result['first']:>8.2f}  {result['warm']:>7.2f}  "
+                f"{', '.join(result['loaded']) or '-'}{errors}"
+            )
+
+
+if __name__ == "__main__":
+    main()
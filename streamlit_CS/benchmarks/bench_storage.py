@@ -0,0 +1,91 @@
+"""Benchmark: load time and resident memory of the processed table, CSV vs Parquet.
+
+Builds an enlarged copy of data/processed/pandemic_events.parquet in a temp
+folder, writes it in the old CSV layout (stringified Coordinates tuple,
+untyped columns) and the typed Parquet layout, then loads each in a fresh
+interpreter the way the Dashboard page does.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_storage.py [rows]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from data.DataEDA import load_processed, to_storage_types
+
+LOADERS = {
+    "csv": """
+df = pd.read_csv(path)
+df["Continent"] = df["Continent"].str.strip().str.title()
+""",
+    "parquet": """
+df = pd.read_parquet(path, memory_map=True)
+""",
+}
+
+CHILD = """
+import json, sys, time
+import pandas as pd
+import pyarrow
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+
+path = sys.argv[1]
+before = rss_mb()
+start = time.perf_counter()
+{loader}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "rss_mb": rss_mb() - before,
+                  "frame_mb": df.memory_usage(deep=True).sum() / 2**20}}))
+"""
+
+
+def measure(fmt, path, repeats=3):
+    runs = []
+    for _ in range(repeats):
+        out = subprocess.run(
+            [sys.executable, "-c", CHILD.format(loader=LOADERS[fmt]), path],
+            check=True, capture_output=True, text=True,
+        )
+        runs.append(json.loads(out.stdout))
+    return min(runs, key=lambda r: r["seconds"])
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    base = load_processed()
+    rng = np.random.default_rng(0)
+    enlarged = base.iloc[rng.integers(0, len(base), n_rows)].reset_index(drop=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "pandemic_events.csv")
+        legacy = enlarged.astype({"Latitude": float, "Longitude": float})
+        legacy.insert(
+            legacy.columns.get_loc("Latitude"), "Coordinates",
+            "(" + legacy["Latitude"].astype(str) + ", " + legacy["Longitude"].astype(str) + ")",
+        )
+        legacy.to_csv(csv_path, index=False)
+
+        parquet_path = os.path.join(tmp, "pandemic_events.parquet")
+        to_storage_types(enlarged).to_parquet(parquet_path, index=False)
+
+        print(f"{n_rows:,} rows")
+        print(f"{'format':>8} {'file MB':>8} {'load s':>7} {'RSS +MB':>8} {'frame MB':>9}")
+        for fmt, path in [("csv", csv_path), ("parquet", parquet_path)]:
+            r = measure(fmt, path)
+            print(f"{fmt:>8} {os.path.getsize(path) / 2**20:>8.1f} {r['seconds']:>7.3f} "
+                  f"{r['rss_mb']:>8.1f} {r['frame_mb']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
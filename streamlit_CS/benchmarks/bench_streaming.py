@@ -0,0 +1,83 @@
+"""Benchmark and equivalence check: build_streaming vs the single-pass build.
+
+Writes an enlarged copy of the raw source to a temp folder, builds it both
+ways in fresh interpreters, reports wall time and peak RSS, and asserts the
+two Parquet outputs and their aggregate cubes hold the same rows.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_streaming.py [rows] [chunksize]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+from data.DataEDA import read_source
+
+CHILD = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+from data.DataEDA import build, build_streaming
+
+mode, source, output, manifest, cube, chunksize = sys.argv[1:]
+start = time.perf_counter()
+if mode == "single":
+    build(source, output, manifest, cube, force=True)
+else:
+    build_streaming(source, output, manifest, cube, chunksize=int(chunksize))
+peak_kb = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+              resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+print(json.dumps({{"seconds": time.perf_counter() - start, "peak_mb": peak_kb / 1024}}))
+"""
+
+
+def run(mode, source, output, manifest, cube, chunksize):
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD.format(root=os.path.abspath(ROOT)),
+         mode, source, output, manifest, cube, str(chunksize)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    chunksize = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    raw = read_source()
+    rng = np.random.default_rng(0)
+    enlarged = raw.iloc[rng.integers(0, len(raw), n_rows)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.csv")
+        enlarged.to_csv(source, index=False)
+
+        results = {}
+        for mode in ("single", "stream"):
+            output = os.path.join(tmp, f"{mode}.parquet")
+            manifest = os.path.join(tmp, f"{mode}.json")
+            cube = os.path.join(tmp, f"{mode}_cube.parquet")
+            results[mode] = run(mode, source, output, manifest, cube, chunksize)
+            print(f"{mode:>7}: {results[mode]['seconds']:.2f}s, "
+                  f"peak RSS {results[mode]['peak_mb']:.0f} MB (largest process)")
+
+        single = pd.read_parquet(os.path.join(tmp, "single.parquet"))
+        stream = pd.read_parquet(os.path.join(tmp, "stream.parquet"))
+        # Category order follows first appearance per row group; compare values
+        pd.testing.assert_frame_equal(single, stream, check_categorical=False)
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(os.path.join(tmp, "single_cube.parquet")),
+            pd.read_parquet(os.path.join(tmp, "stream_cube.parquet")),
+            check_categorical=False,
+        )
+        print(f"Outputs match: {len(single):,} rows from {n_rows:,} input rows "
+              f"({os.cpu_count()} cores, chunksize {chunksize:,}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark: charting weeks of live readings from utils.timeseries_store.
+
+Fills a temporary store with one reading per minute for a few weeks (a
+sine wave with noise, one spike and one dip), then times range queries
+downsampled to CHART_POINTS and checks that the spike and the dip survive
+the downsampling, which an every-nth sample does not guarantee.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_timeseries.py [days]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from utils.timeseries_store import TimeSeriesStore
+
+CHART_POINTS = 800
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 21
+    times = pd.date_range("2026-01-01", periods=days * 24 * 60, freq="min", tz="UTC")
+    rng = np.random.default_rng(0)
+    values = 10 * np.sin(np.arange(len(times)) / 720) + rng.normal(0, 0.5, len(times))
+    spike, dip = len(times) // 3, 2 * len(times) // 3
+    values[spike], values[dip] = 80.0, -60.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TimeSeriesStore(os.path.join(tmp, "history.sqlite3"))
+        start = time.perf_counter()
+        with store._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO readings VALUES (?, ?, ?, ?)",
+                [("bench", "temperature", t.timestamp(), float(v)) for t, v in zip(times, values)],
+            )
+        print(f"inserted {len(times):,} readings in {time.perf_counter() - start:.2f} s")
+
+        print(f"{'range':<10}  {'raw rows':>9}  {'charted':>7}  {'query ms':>8}  {'max':>6}  {'min':>6}")
+        for label, span in (("full", times[-1] - times[0]), ("1 day", pd.Timedelta(days=1)), ("1 hour", pd.Timedelta(hours=1))):
+            end = times[-1]
+            raw = int(((times >= end - span) & (times <= end)).sum())
+            start = time.perf_counter()
+            frame = store.query("bench", ["temperature"], end - span, end, points=CHART_POINTS)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{label:<10}  {raw:>9,}  {len(frame):>7}  {elapsed:>8.1f}  {frame['value'].max():>6.1f}  {frame['value'].min():>6.1f}")
+
+        step = len(times) // CHART_POINTS
+        nth = values[::step]
+        print(f"every-nth sample of the full range: max {nth.max():.1f}, min {nth.min():.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark: viewport queries, boolean mask over every event vs the grid index.
+
+Scatters N events over the globe and times bounding-box queries at the
+viewport sizes of a few zoom levels, checking both methods return the
+same rows.
+
+Run from the streamlit_CS folder:
+    python benchmarks/bench_viewport.py [events]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from utils.spatial import GridIndex
+
+# Rough viewport size in degrees (width, height) of an 800x500 map at each zoom
+VIEWPORTS = {2: (280, 140), 4: (70, 44), 6: (17.6, 11), 8: (4.4, 2.7)}
+QUERIES = 50
+
+
+def mask_query(lat, lon, south, west, north, east):
+    return np.nonzero((lat >= south) & (lat <= north) & (lon >= west) & (lon <= east))[0]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(-80, 80, n)
+    lon = rng.uniform(-180, 180, n)
+
+    start = time.perf_counter()
+    grid = GridIndex(lat, lon)
+    print(f"{n:,} events, grid built in {time.perf_counter() - start:.2f} s")
+    print(f"{'zoom':>4}  {'in view':>9}  {'mask ms':>8}  {'grid ms':>8}")
+
+    for zoom, (width, height) in VIEWPORTS.items():
+        boxes = []
+        for _ in range(QUERIES):
+            west = rng.uniform(-180, 180 - width)
+            south = rng.uniform(-80, 80 - height)
+            boxes.append((south, west, south + height, west + width))
+        timings = {}
+        for name, query in (("mask", lambda box: mask_query(lat, lon, *box)), ("grid", lambda box: grid.query(*box))):
+            start = time.perf_counter()
+            results = [query(box) for box in boxes]
+            timings[name] = (time.perf_counter() - start) / QUERIES * 1000, results
+        assert all(np.array_equal(a, b) for a, b in zip(timings["mask"][1], timings["grid"][1]))
+        found = np.mean([len(r) for r in timings["grid"][1]])
+        print(f"{zoom:>4}  {found:>9,.0f}  {timings['mask'][0]:>8.2f}  {timings['grid'][0]:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Local stub HTTP server for exercising the live-data fetch code offline.
+
+StubServer answers every GET with a fixed JSON payload, or with
+payload(path) when given a function, unless responses were queued with
+queue(), which are served first, in order. It counts
+requests, distinct client connections (to see keep-alive at work) and
+the most requests in flight at once (to see a concurrency cap).
+
+    with StubServer({"bitcoin": {"usd": 68000}}, delay=0.1) as server:
+        server.queue(429, {"Retry-After": "1"})
+        requests.get(server.url("/simple/price"))
+
+Scripts in this folder import it as `from stub_server import StubServer`.
+"""
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # lets clients reuse the connection
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def do_GET(self):
+        stub = self.server.stub
+        status, headers, body = stub._begin(self.client_address, self.path)
+        try:
+            if stub.delay:
+                time.sleep(stub.delay)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            stub._end()
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # bursts of connections from concurrency tests
+
+
+class StubServer:
+    """Threaded server on 127.0.0.1 with a random free port; use as a context manager."""
+
+    def __init__(self, payload=None, delay=0.0):
+        self.payload = payload if callable(payload) else json.dumps({} if payload is None else payload).encode()
+        self.delay = delay
+        self._script = deque()
+        self._lock = threading.Lock()
+        self.reset()
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def url(self, path="/"):
+        return f"http://127.0.0.1:{self._server.server_port}{path}"
+
+    def queue(self, status, headers=None, payload=None):
+        """Serve this response to the next request instead of the default one."""
+        body = None if payload is None else json.dumps(payload).encode()
+        with self._lock:
+            self._script.append((status, dict(headers or {}), body))
+
+    def reset(self):
+        """Zero the counters and drop any queued responses."""
+        with self._lock:
+            self._script.clear()
+            self.requests = 0
+            self.in_flight = 0
+            self.peak_in_flight = 0
+            self._clients = set()
+
+    @property
+    def connections(self):
+        """Distinct client (address, port) pairs seen, i.e. TCP connections opened."""
+        with self._lock:
+            return len(self._clients)
+
+    def _body(self, path):
+        return json.dumps(self.payload(path)).encode() if callable(self.payload) else self.payload
+
+    def _begin(self, client, path):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self._clients.add(client)
+            status, headers, body = self._script.popleft() if self._script else (200, {}, None)
+        return status, headers, self._body(path) if body is None else body
+
+    def _end(self):
+        with self._lock:
+            self.in_flight -= 1
@@ -1,20 +1,51 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import argparse
+import hashlib
+import json
 import re
 import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-# Load Data
-# Correctly construct the path relative to this script file
-data_path = os.path.join(os.path.dirname(__file__), "PandemicChronoTable.csv")
-df = pd.read_csv(data_path)
+DATA_DIR = os.path.dirname(__file__)
+# Raw scraped table; the build never writes to it
+SOURCE_PATH = os.path.join(DATA_DIR, "PandemicChronoTable.csv")
+PROCESSED_DIR = os.path.join(DATA_DIR, "processed")
+PROCESSED_PATH = os.path.join(PROCESSED_DIR, "pandemic_events.parquet")
+MANIFEST_PATH = os.path.join(PROCESSED_DIR, "pandemic_events.manifest.json")
+CUBE_PATH = os.path.join(PROCESSED_DIR, "pandemic_cube.parquet")
 
-# --- DATA CLEANING ---
-
-# Drop useless columns if they exist
-df.drop(columns=['Unnamed: 0', 'Ref.'], inplace=True, errors='ignore')
+RAW_COLUMNS = ["Event", "Date", "Location", "Disease", "Death toll (estimate)"]
+# Column dtypes of the processed artifact
+CATEGORY_COLUMNS = ["Disease", "Location", "Continent", "Coord_Match", "Coord_Key"]
+STORAGE_DTYPES = {
+    "Latitude": "float32", "Longitude": "float32", "Disease_Known": "bool",
+    "start_year": "Int32", "end_year": "Int32",
+}
+# Fixed Arrow layout so every build mode (and every streamed chunk) writes the same schema
+LABEL = pa.dictionary(pa.int32(), pa.string())
+PROCESSED_SCHEMA = pa.schema([
+    ("Event", pa.string()), ("Date", pa.string()), ("Location", LABEL), ("Disease", LABEL),
+    ("Death toll (estimate)", pa.string()), ("Row_Hash", pa.uint64()), ("Disease_Known", pa.bool_()),
+    ("Continent", LABEL), ("Latitude", pa.float32()), ("Longitude", pa.float32()),
+    ("Coord_Match", LABEL), ("Coord_Key", LABEL), ("Death Toll (est)", pa.float64()),
+    ("start_year", pa.int32()), ("end_year", pa.int32()),
+])
+# Aggregate cube: one row per Disease x Continent x Era with summed deaths and event counts
+ERA_YEARS = 100
+CUBE_DIMENSIONS = ["Disease", "Continent", "Era"]
+CUBE_SCHEMA = pa.schema([
+    ("Disease", LABEL), ("Continent", LABEL), ("Era", pa.int32()),
+    ("Deaths", pa.float64()), ("Events", pa.int64()),
+])
+# Bump when process() or the cube changes so cached rows are rebuilt instead of reused
+PIPELINE_VERSION = 6
 
-# Separate unknown disease events
-df["Disease_Known"] = ~df["Disease"].str.contains("unknown", case=False, na=False)
 
 # --- CONTINENT MAPPING ---
 # This mapping helps group locations into continents.
@@ -89,8 +120,6 @@ continent_map = {
     "Worldwide, primarily concentrated in Guinea, Liberia, Sierra Leone": "Global",
     "Byzantine Empire, West Asia, Africa": "Multiple",
 }
-df["Continent"] = df["Location"].map(continent_map).fillna("Unknown")
-df["Continent"] = df["Continent"].str.strip().str.title()
 
 
 # --- COORDINATE MAPPING (REFINED) ---
@@ -114,33 +143,136 @@ coords_map = {
     "Asia, North Africa, Europe": (35, 25), "Asia, Africa, Europe, and Americas": (0,0),
 }
 
+
+# --- LOCATION RESOLVER ---
+def normalize_location(text):
+    """Lowercase and collapse whitespace so lookups ignore formatting noise."""
+    return " ".join(str(text).lower().split())
+
+
+class LocationResolver:
+    """Resolve free-text locations to coordinates with a prebuilt keyword index.
+
+    Keys are compiled once into an Aho-Corasick automaton, so a location is
+    scanned a single time no matter how many keys exist. Partial matches must
+    sit on word boundaries; the longest key wins and ties go to the later key,
+    because locations read "place, region" (e.g. "New France, Canada").
+    Results are memoized per distinct location string.
+    """
+
+    def __init__(self, coords, default=(0, 0)):
+        self.coords = {key: (float(lat), float(lon)) for key, (lat, lon) in coords.items()}
+        self.default = (float(default[0]), float(default[1]))
+        self._exact = {normalize_location(k): k for k in self.coords}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._cache = {}
+
+        for norm, key in self._exact.items():
+            state = 0
+            for ch in norm:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(norm), key))
+
+        # Breadth-first pass to wire failure links and inherit their outputs
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+                queue.append(nxt)
+
+    def _best_partial(self, text):
+        best = None  # (length, end, key)
+        state = 0
+        for end, ch in enumerate(text, start=1):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for length, key in self._out[state]:
+                start = end - length
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end < len(text) and text[end].isalnum():
+                    continue
+                if best is None or (length, end) >= best[:2]:
+                    best = (length, end, key)
+        return best[2] if best else None
+
+    def resolve(self, location):
+        """Return (lat, lon, match, key) where match is exact/partial/none."""
+        if location in self._cache:
+            return self._cache[location]
+
+        if pd.isna(location):
+            result = (*self.default, "none", None)
+        else:
+            norm = normalize_location(location)
+            key = self._exact.get(norm)
+            if key is not None:
+                result = (*self.coords[key], "exact", key)
+            else:
+                key = self._best_partial(norm)
+                if key is not None:
+                    result = (*self.coords[key], "partial", key)
+                else:
+                    result = (*self.default, "none", None)
+
+        self._cache[location] = result
+        return result
+
+    def resolve_series(self, locations):
+        """Resolve a column once per distinct value and broadcast back to rows."""
+        codes, uniques = pd.factorize(locations, use_na_sentinel=False)
+        resolved = pd.DataFrame(
+            [self.resolve(loc) for loc in uniques],
+            columns=["Latitude", "Longitude", "Coord_Match", "Coord_Key"],
+        )
+        resolved = resolved.iloc[codes].reset_index(drop=True)
+        resolved.index = locations.index
+        return resolved
+
+
+location_resolver = LocationResolver(coords_map)
+
+
 # Function to get the best coordinate match
 def get_coords(location):
-    # First, try for an exact match
-    if location in coords_map:
-        return coords_map[location]
-    # If no exact match, find the best partial match from the keys
-    for key, val in coords_map.items():
-        if key.lower() in location.lower():
-            return val
-    return (0, 0) # Default if no match is found
-
-df["Coordinates"] = df["Location"].apply(get_coords)
-df[["Latitude", "Longitude"]] = df["Coordinates"].apply(pd.Series)
+    lat, lon, _, _ = location_resolver.resolve(location)
+    return (lat, lon)
 
 
 # --- DEATH TOLL PARSING ---
+UNKNOWN_MARKERS = ("unknown", "n/a", "not known", "no data")
+# Checked in order; the first unit word present wins
+UNIT_WORDS = (("billion", 1_000_000_000), ("million", 1_000_000), ("thousand", 1_000))
+NUMBER_PATTERN = r"[\d,.]+"
+
+
 def parse_death_toll(value):
     if pd.isna(value): return np.nan
     s = str(value).lower().strip()
-    if any(tok in s for tok in ("unknown", "n/a", "not known", "no data")): return np.nan
+    if any(tok in s for tok in UNKNOWN_MARKERS): return np.nan
 
     unit = 1
-    if "billion" in s: unit = 1_000_000_000
-    elif "million" in s: unit = 1_000_000
-    elif "thousand" in s: unit = 1_000
+    for word, factor in UNIT_WORDS:
+        if word in s:
+            unit = factor
+            break
 
-    numbers = re.findall(r"[\d,.]+", s)
+    numbers = re.findall(NUMBER_PATTERN, s)
     if not numbers: return np.nan
     
     cleaned_numbers = []
@@ -155,17 +287,377 @@ def parse_death_toll(value):
     # Return the highest number found, multiplied by the unit
     return max(cleaned_numbers) * unit
 
-df["Death Toll (est)"] = df["Death toll (estimate)"].apply(parse_death_toll)
 
+def parse_death_toll_column(values):
+    """Column-at-a-time equivalent of parse_death_toll.
+
+    The column is factorized first, so each distinct string is parsed once
+    by parse_death_toll and the results are broadcast back to the rows.
+    Death-toll text repeats heavily, so this is where the time goes; the
+    per-string work stays the scalar parser's.
+    """
+    codes, uniques = pd.factorize(values)
+    parsed = np.array([parse_death_toll(value) for value in uniques.tolist()], dtype=float)
+    # factorize marks missing values with -1; point those at a trailing NaN
+    parsed = np.append(parsed, np.nan)
+    return pd.Series(parsed[codes], index=values.index)
+
+
+# --- DATE PARSING ---
+# "541–549", "1489", "430–426 BC", "2019–present", "c. 1500", "1817–24", "AD 541"
+# A year must end at a word boundary, so "12th century" is not read as 12
+DATE_PATTERN = (
+    r"^\s*(?:c\.|ca\.|circa)?\s*(?:(?:ad|ce)\s*)?(?P<start>\d{1,4})(?!\d)\s*(?P<start_era>bce?|ad|ce)?(?!\w)"
+    r"(?:\s*(?:[–—-]|to)\s*(?:(?:ad|ce)?\s*(?P<end>\d{1,4})(?!\d)\s*(?P<end_era>bce?|ad|ce)?(?!\w)"
+    r"|(?P<present>present|ongoing)))?"
+)
+
+
+def parse_date_column(values, current_year=None):
+    """Derive integer start_year/end_year from free-text dates (BC years are negative).
+
+    Single years give start == end, "present" ends at current_year (the
+    build year by default), and an era written only after the range end
+    ("430–426 BC") applies to both ends. A two-digit end below a two-digit
+    start rolls into the next century ("99–01" -> 99 to 101); any other
+    range that ends before it starts, and any unparseable date, is <NA>.
+    """
+    current_year = current_year or pd.Timestamp.now().year
+    parts = values.astype("string").str.lower().str.extract(DATE_PATTERN)
+
+    start = pd.to_numeric(parts["start"]).astype("Int32")
+    end = pd.to_numeric(parts["end"]).astype("Int32")
+
+    # Abbreviated range ends borrow the start's leading digits: "1817–24" -> 1824,
+    # and "99–01" (no era on either side) -> 101
+    start_len, end_len = parts["start"].str.len(), parts["end"].str.len()
+    no_era = parts["start_era"].isna() & parts["end_era"].isna()
+    wraps = (start_len == end_len) & (end_len <= 2) & (end < start) & no_era
+    short = ((end_len < start_len) | wraps).fillna(False)
+    scale = 10 ** end_len.astype("Int32")
+    expanded = start - start % scale + end
+    expanded = expanded.mask(expanded < start, expanded + scale)
+    end = end.mask(short, expanded)
+
+    start_bc = parts["start_era"].str.startswith("bc").fillna(False)
+    end_bc = parts["end_era"].str.startswith("bc").fillna(False)
+    start_bc |= end_bc & parts["start_era"].isna()
+
+    start = start.mask(start_bc, -start)
+    end = end.mask(end_bc, -end)
+    end = end.fillna(start)
+    end = end.mask(parts["present"].notna(), current_year)
+    # Still reversed ("1920–1918"): there is no telling which year is the typo
+    reversed_range = (end < start).fillna(False)
+    start, end = start.mask(reversed_range), end.mask(reversed_range)
+    return pd.DataFrame({"start_year": start, "end_year": end.astype("Int32")}, index=values.index)
+
+
+# --- PIPELINE ---
+def process(df):
+    """Clean a raw pandemic table and derive continent, coordinates and death toll."""
+    df = df.copy()
+
+    # Drop useless columns if they exist
+    df.drop(columns=['Unnamed: 0', 'Ref.'], inplace=True, errors='ignore')
+
+    # Separate unknown disease events
+    df["Disease_Known"] = ~df["Disease"].str.contains("unknown", case=False, na=False)
+
+    df["Continent"] = df["Location"].map(continent_map).fillna("Unknown")
+    df["Continent"] = df["Continent"].str.strip().str.title()
+
+    resolved = location_resolver.resolve_series(df["Location"])
+    df[["Latitude", "Longitude", "Coord_Match", "Coord_Key"]] = resolved
+
+    df["Death Toll (est)"] = parse_death_toll_column(df["Death toll (estimate)"])
+    df[["start_year", "end_year"]] = parse_date_column(df["Date"])
+
+    # --- FINAL CLEANUP ---
+    # Remove rows where essential data is missing for the map
+    df_cleaned = df.dropna(subset=["Latitude", "Longitude", "Death Toll (est)", "Continent"])
+    df_cleaned = df_cleaned[df_cleaned["Continent"] != "Unknown"]
+    return df_cleaned
+
+
+# --- AGGREGATE CUBE ---
+def build_cube(df):
+    """Deaths and event counts per Disease x Continent x Era for processed rows.
+
+    An event belongs to the era (century) its start year falls in; rows
+    without a parsed date are left out. Both measures are sums, so cubes
+    of separate chunks merge exactly with combine_cubes.
+    """
+    era = (df["start_year"] // ERA_YEARS) * ERA_YEARS
+    return (
+        df.assign(Era=era)
+        .dropna(subset=["Era"])
+        .groupby(CUBE_DIMENSIONS, observed=True)
+        .agg(Deaths=("Death Toll (est)", "sum"), Events=("Death Toll (est)", "size"))
+        .reset_index()
+    )
+
+
+def combine_cubes(cubes):
+    if not cubes:
+        return pd.DataFrame({"Disease": [], "Continent": [], "Era": [], "Deaths": [], "Events": []})
+    cube = pd.concat(cubes, ignore_index=True).astype({"Disease": str, "Continent": str})
+    return cube.groupby(CUBE_DIMENSIONS, as_index=False)[["Deaths", "Events"]].sum()
+
+
+def write_cube(cube, path=CUBE_PATH):
+    cube = cube.sort_values(CUBE_DIMENSIONS).astype(
+        {"Disease": "category", "Continent": "category", "Era": "int32", "Events": "int64"}
+    )
+    table = pa.Table.from_pandas(cube, schema=CUBE_SCHEMA, preserve_index=False)
+    atomic_write(path, lambda tmp: pq.write_table(table, tmp))
+
+
+def cube_path_for(output_path):
+    """The cube that belongs to a processed table: same folder, CUBE_PATH's file name."""
+    return os.path.join(os.path.dirname(output_path), os.path.basename(CUBE_PATH))
+
+
+def cube_matches(cube_path, manifest):
+    """True if the cube on disk counts as many events as the manifest says the build put in it."""
+    if not os.path.exists(cube_path) or "cube_events" not in manifest:
+        return False
+    events = pq.read_table(cube_path, columns=["Events"]).column("Events").to_numpy()
+    return int(events.sum()) == manifest["cube_events"]
+
+
+# --- INCREMENTAL BUILD ---
+def read_source(path=SOURCE_PATH, **kwargs):
+    """Read the raw columns as text so every chunk of a file gets the same dtypes."""
+    return pd.read_csv(path, usecols=RAW_COLUMNS, dtype=str, **kwargs)
+
+
+def hash_rows(df):
+    """Content hash of the raw columns for every row (uint64)."""
+    return pd.util.hash_pandas_object(df[RAW_COLUMNS], index=False).to_numpy()
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def atomic_write(path, write):
+    """Call write(tmp_path), then move the finished file into place.
+
+    os.replace is atomic on the same filesystem, so readers see either the
+    old file or the new one, never a partial write.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    # mkstemp creates the file owner-only; give the output normal permissions
+    os.chmod(tmp_path, 0o644)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def to_storage_types(df):
+    """Categoricals for repeated labels, float32 coordinates, boolean flags."""
+    return df.astype({**{col: "category" for col in CATEGORY_COLUMNS}, **STORAGE_DTYPES})
+
+
+def to_arrow(df):
+    return pa.Table.from_pandas(to_storage_types(df), schema=PROCESSED_SCHEMA, preserve_index=False)
+
+
+def writer_schema():
+    """PROCESSED_SCHEMA plus the pandas metadata to_arrow attaches, for writers fed chunk by chunk.
+
+    Without it, nullable columns such as start_year read back as plain
+    int32 instead of the Int32 a single-pass build produces.
+    """
+    empty = pd.DataFrame({name: pd.Series(dtype=object) for name in PROCESSED_SCHEMA.names})
+    return to_arrow(empty).schema
+
+
+def load_processed(path=PROCESSED_PATH):
+    """Read the processed Parquet artifact, memory-mapping the file."""
+    return pd.read_parquet(path, memory_map=True)
+
+
+def build(source_path=SOURCE_PATH, output_path=PROCESSED_PATH,
+          manifest_path=MANIFEST_PATH, cube_path=None, force=False):
+    """Build the processed table and its aggregate cube, reparsing only rows whose content changed.
+
+    Rows are keyed by a hash of their raw columns. Kept rows are reused from
+    the previous artifact and rows the cleanup dropped are remembered in the
+    manifest, so an unchanged row is never parsed twice. The cube is written
+    before the table, so a reader that sees the new table also finds the
+    matching cube. The cube defaults to the table's folder; an existing
+    one is only trusted if its event total matches the manifest. Returns
+    the manifest.
+    """
+    cube_path = cube_path or cube_path_for(output_path)
+    source_sha = file_sha256(source_path)
+    manifest = None if force else load_manifest(manifest_path)
+    if manifest and manifest.get("pipeline_version") != PIPELINE_VERSION:
+        manifest = None
+
+    if (manifest and manifest["source_sha256"] == source_sha
+            and os.path.exists(output_path) and cube_matches(cube_path, manifest)):
+        return dict(manifest, rows_reused=manifest["rows_in"], rows_parsed=0, rows_skipped=0)
+
+    raw = read_source(source_path)
+    raw["Row_Hash"] = hash_rows(raw)
+
+    if manifest and os.path.exists(output_path):
+        previous = load_processed(output_path).drop_duplicates("Row_Hash").set_index("Row_Hash")
+        dropped = set(manifest["dropped_hashes"])
+    else:
+        previous = pd.DataFrame()
+        dropped = set()
+
+    reuse = raw["Row_Hash"].isin(previous.index).to_numpy()
+    skip = raw["Row_Hash"].isin(dropped).to_numpy()
+    todo = raw[~reuse & ~skip]
+
+    fresh = process(todo)
+    if reuse.any():
+        reused = previous.loc[raw.loc[reuse, "Row_Hash"]].reset_index()
+        reused.index = raw.index[reuse]
+        # Keep source order and the column layout process() produces
+        result = pd.concat([fresh, reused[fresh.columns]]).sort_index()
+    else:
+        result = fresh
+
+    dropped = (dropped & set(raw["Row_Hash"].tolist())) | (
+        set(todo["Row_Hash"].tolist()) - set(fresh["Row_Hash"].tolist())
+    )
+
+    cube = build_cube(result)
+    write_cube(cube, cube_path)
+    table = to_arrow(result)
+    atomic_write(output_path, lambda tmp: pq.write_table(table, tmp))
+    return _write_manifest(
+        manifest_path, source_path, source_sha, dropped,
+        rows_in=len(raw), rows_out=len(result), rows_reused=int(reuse.sum()),
+        rows_skipped=int((skip & ~reuse).sum()), rows_parsed=len(todo),
+        cube_rows=len(cube), cube_events=int(cube["Events"].sum()),
+    )
+
+
+# --- STREAMING BUILD ---
+def _process_chunk(chunk):
+    """Worker task: hash and process one chunk, returning its Arrow table, dropped hashes and partial cube."""
+    chunk["Row_Hash"] = hash_rows(chunk)
+    kept = process(chunk)
+    dropped = set(chunk["Row_Hash"].tolist()) - set(kept["Row_Hash"].tolist())
+    return to_arrow(kept), dropped, build_cube(kept)
+
+
+def build_streaming(source_path=SOURCE_PATH, output_path=PROCESSED_PATH,
+                    manifest_path=MANIFEST_PATH, cube_path=None, chunksize=100_000, workers=None):
+    """Full rebuild for inputs too large to hold in memory.
+
+    The source is read in chunks that are processed on a process pool. At
+    most two chunks per worker are in flight, and finished chunks are
+    appended to the Parquet file in source order as row groups, so memory
+    stays bounded by the chunk size rather than the input size. Produces the
+    same rows and schema as build(force=True). Each chunk also returns its
+    partial cube; those are small and are summed at the end.
+    """
+    workers = workers or os.cpu_count() or 1
+    cube_path = cube_path or cube_path_for(output_path)
+    source_sha = file_sha256(source_path)
+    chunks = read_source(source_path, chunksize=chunksize)
+    dropped = set()
+    cubes = []
+    counts = {"rows_in": 0, "rows_out": 0}
+
+    def write(tmp_path):
+        with ProcessPoolExecutor(max_workers=workers) as pool, \
+                pq.ParquetWriter(tmp_path, writer_schema()) as writer:
+            pending = deque()
+            for chunk in chunks:
+                counts["rows_in"] += len(chunk)
+                pending.append(pool.submit(_process_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    _write_chunk(writer, pending.popleft().result(), dropped, cubes, counts)
+            while pending:
+                _write_chunk(writer, pending.popleft().result(), dropped, cubes, counts)
+        # Every chunk is in; the cube goes into place just before the table does
+        cube = combine_cubes(cubes)
+        write_cube(cube, cube_path)
+        counts["cube_rows"] = len(cube)
+        counts["cube_events"] = int(cube["Events"].sum())
+
+    atomic_write(output_path, write)
+    return _write_manifest(
+        manifest_path, source_path, source_sha, dropped,
+        rows_in=counts["rows_in"], rows_out=counts["rows_out"], rows_reused=0,
+        rows_skipped=0, rows_parsed=counts["rows_in"],
+        cube_rows=counts["cube_rows"], cube_events=counts["cube_events"],
+    )
+
+
+def _write_chunk(writer, result, dropped, cubes, counts):
+    table, chunk_dropped, cube = result
+    writer.write_table(table)
+    dropped |= chunk_dropped
+    cubes.append(cube)
+    counts["rows_out"] += table.num_rows
+
+
+def _write_manifest(path, source_path, source_sha, dropped, **counts):
+    manifest = {
+        "pipeline_version": PIPELINE_VERSION,
+        "source": os.path.basename(source_path),
+        "source_sha256": source_sha,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        **counts,
+        "dropped_hashes": sorted(dropped),
+    }
+    atomic_write(path, lambda tmp: _write_json(tmp, manifest))
+    return manifest
+
+
+def _write_json(path, obj):
+    with open(path, "w") as f:
+        json.dump(obj, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the processed pandemic table.")
+    parser.add_argument("--force", action="store_true", help="ignore cached rows and rebuild everything")
+    parser.add_argument("--stream", action="store_true",
+                        help="full rebuild in chunks on a process pool (for very large inputs)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="rows per chunk in --stream mode")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes in --stream mode")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.stream:
+        manifest = build_streaming(chunksize=args.chunksize, workers=args.workers)
+    else:
+        manifest = build(force=args.force)
+    elapsed = time.perf_counter() - start
 
-# --- FINAL CLEANUP & SAVE ---
-# Remove rows where essential data is missing for the map
-df_cleaned = df.dropna(subset=["Latitude", "Longitude", "Death Toll (est)", "Continent"])
-df_cleaned = df_cleaned[df_cleaned["Continent"] != "Unknown"]
+    print(
+        f"Data cleaning and processing complete in {elapsed:.2f}s: "
+        f"{manifest['rows_out']} rows written to `processed/{os.path.basename(PROCESSED_PATH)}` "
+        f"({manifest['rows_parsed']} parsed, {manifest['rows_reused']} reused)."
+    )
 
-# Overwrite the original CSV with the cleaned and processed data
-# This ensures the Streamlit app always reads clean data
-output_path = os.path.join(os.path.dirname(__file__), "PandemicChronoTable.csv")
-df_cleaned.to_csv(output_path, index=False)
 
-print("Data cleaning and processing complete. `PandemicChronoTable.csv` has been updated.")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
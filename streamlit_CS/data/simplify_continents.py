@@ -0,0 +1,84 @@
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+import json
+import os
+
+DATA_DIR = os.path.dirname(__file__)
+SOURCE_PATH = os.path.join(DATA_DIR, "continents.geojson")
+PROCESSED_DIR = os.path.join(DATA_DIR, "processed")
+
+# Simplification tolerance (degrees) per level. The Dashboard picks a level
+# from the map zoom; above the most detailed level it uses the source file.
+LEVELS = {"low": 0.5, "medium": 0.1, "high": 0.02}
+
+
+def layer_path(level):
+    return os.path.join(PROCESSED_DIR, f"continents_{level}.geojson")
+
+
+def simplify_layer(gdf, tolerance):
+    """Simplify each continent without breaking its rings.
+
+    Polygon parts smaller than a couple of tolerance cells (tiny islands that
+    would render as a dot) are dropped, keeping at least each continent's
+    largest part. simplify(preserve_topology=True) keeps every ring valid
+    and non-self-intersecting, and coordinates are snapped to a grid a tenth
+    of the tolerance so they serialize short. Each continent is unioned back
+    together on that grid so the result is a valid (Multi)Polygon.
+    """
+    parts = gdf.explode(index_parts=False)
+    # Planar area in square degrees is enough to rank parts against the tolerance
+    area = pd.Series(shapely.area(parts.geometry.values), index=parts.index)
+    largest = area == area.groupby(level=0).transform("max")
+    parts = parts[((area >= (2 * tolerance) ** 2) | largest).to_numpy()]
+
+    geoms = parts.geometry.simplify(tolerance, preserve_topology=True)
+    grid = tolerance / 10
+    parts = parts.set_geometry(shapely.set_precision(geoms.values, grid))
+    # Snapping can split or collapse a polygon; keep the non-empty pieces
+    parts = parts.explode(index_parts=False)
+    parts = parts[~parts.geometry.is_empty]
+    grouped = parts.groupby(level=0)
+    return gpd.GeoDataFrame(
+        {
+            "CONTINENT": grouped["CONTINENT"].first(),
+            # Parts simplified independently can overlap; union them back into a valid shape
+            "geometry": grouped["geometry"].agg(lambda g: shapely.union_all(g.values, grid_size=grid)),
+        },
+        geometry="geometry",
+        crs=gdf.crs,
+    )
+
+
+def to_compact_geojson(gdf, decimals):
+    """Serialize with rounded coordinates, feature ids and no whitespace."""
+    geoms = shapely.transform(gdf.geometry.values, lambda coords: np.round(coords, decimals))
+    collection = gdf.set_geometry(geoms).__geo_interface__
+    for feature in collection["features"]:
+        # A unique id keeps folium from adding (and mutating) one on a cached dict
+        feature["id"] = feature["properties"]["CONTINENT"]
+        feature.pop("bbox", None)
+    collection.pop("bbox", None)
+    return json.dumps(collection, separators=(",", ":"))
+
+
+def main():
+    continents = gpd.read_file(SOURCE_PATH)
+    os.makedirs(PROCESSED_DIR, exist_ok=True)
+    print(f"source: {os.path.getsize(SOURCE_PATH):>9,} bytes, "
+          f"{shapely.get_num_coordinates(continents.geometry.values).sum():,} points")
+
+    for level, tolerance in LEVELS.items():
+        layer = simplify_layer(continents, tolerance)
+        decimals = max(0, int(np.ceil(-np.log10(tolerance / 10))))
+        with open(layer_path(level), "w") as f:
+            f.write(to_compact_geojson(layer, decimals))
+        print(f"{level:>6}: {os.path.getsize(layer_path(level)):>9,} bytes, "
+              f"{shapely.get_num_coordinates(layer.geometry.values).sum():,} points "
+              f"(tolerance {tolerance}°)")
+
+
+if __name__ == "__main__":
+    main()
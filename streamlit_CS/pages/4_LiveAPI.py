@@ -1,8 +1,14 @@
 import streamlit as st
 import pandas as pd
-import requests
 import plotly.express as px
 import time
+from utils.fetch_cache import cached_fetch, get_fetch_cache, render_cache_panel
+from utils.http_client import get_client, render_metrics_panel
+from utils.poller import get_poller
+from utils.profiling import SectionTimer, debug_enabled, render_debug_panel
+from utils.ring_buffer import ReadingBuffer
+from utils.timeseries_store import get_store
+from utils.weather import fetch_current
 
 # Read API 
 # Streamlit page setup
@@ -10,87 +16,202 @@ import time
 st.set_page_config(page_title="Live Weather API Demo", page_icon="📡", layout="wide")
 
 st.title("📡 Simple Weather Live Data Demo (Open-Meteo)")
-st.caption("Live temperature data with auto-refresh and growing trend line.")
+st.caption("Live temperature data across Colorado with auto-refresh and growing trend line.")
 
 # --- Config ---
-lat, lon = 39.7392, -104.9903  # Denver
-wurl = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,wind_speed_10m"
-HEADERS = {"User-Agent": "msudenver-dataviz-class/1.0", "Accept": "application/json"}
+# Monitored sites, name -> (lat, lon); all of them are fetched in one batched request
+SITES = {
+    "Denver": (39.7392, -104.9903),
+    "Boulder": (40.0150, -105.2705),
+    "Colorado Springs": (38.8339, -104.8214),
+    "Fort Collins": (40.5853, -105.0844),
+    "Aurora": (39.7294, -104.8319),
+    "Lakewood": (39.7047, -105.0814),
+    "Longmont": (40.1672, -105.1019),
+    "Loveland": (40.3978, -105.0750),
+    "Greeley": (40.4233, -104.7091),
+    "Castle Rock": (39.3722, -104.8561),
+    "Pueblo": (38.2544, -104.6091),
+    "Canon City": (38.4409, -105.2424),
+    "Trinidad": (37.1695, -104.5005),
+    "Alamosa": (37.4695, -105.8700),
+    "Salida": (38.5347, -105.9989),
+    "Gunnison": (38.5458, -106.9253),
+    "Leadville": (39.2508, -106.2925),
+    "Breckenridge": (39.4817, -106.0384),
+    "Vail": (39.6403, -106.3742),
+    "Aspen": (39.1911, -106.8175),
+    "Glenwood Springs": (39.5505, -107.3248),
+    "Steamboat Springs": (40.4850, -106.8317),
+    "Craig": (40.5153, -107.5464),
+    "Estes Park": (40.3772, -105.5217),
+    "Grand Junction": (39.0639, -108.5506),
+    "Montrose": (38.4783, -107.8762),
+    "Telluride": (37.9375, -107.8123),
+    "Durango": (37.2753, -107.8801),
+    "Cortez": (37.3489, -108.5859),
+    "Sterling": (40.6255, -103.2077),
+    "Limon": (39.2639, -103.6922),
+    "Lamar": (38.0872, -102.6207),
+}
+# Site shown in the live trend and kept in the history store
+FEATURED = "Denver"
 
 SAMPLE_DF = pd.DataFrame([
-    {"time": pd.Timestamp.now(), "temperature": 20.0, "wind": 5.0}
+    {"location": FEATURED, "latitude": SITES[FEATURED][0], "longitude": SITES[FEATURED][1],
+     "time": pd.Timestamp.now(), "temperature": 20.0, "wind": 5.0}
 ])
 
-# --- Cached Fetch ---
-@st.cache_data(ttl=600, show_spinner=False)
+# Seconds between upstream calls; shared by every viewer in this process
+POLL_SEC = 60
+
+# Stored-history ranges offered on the page, and the most points per line sent to the chart
+HISTORY_WINDOWS = {
+    "Last hour": pd.Timedelta(hours=1),
+    "Last day": pd.Timedelta(days=1),
+    "Last week": pd.Timedelta(weeks=1),
+    "Last 30 days": pd.Timedelta(days=30),
+}
+CHART_POINTS = 800
+
+# --- Fetch ---
+# Pooled keep-alive session shared by the live pages; retries 429/5xx and
+# network errors with backoff, honouring Retry-After
+http = get_client()
+
 def get_weather():
-    """Fetch current weather safely. Returns (df, err_msg)."""
-    try:
-        r = requests.get(wurl, timeout=10, headers=HEADERS)
-        if r.status_code == 429:
-            retry_after = r.headers.get("Retry-After", "a bit")
-            return None, f"429 Too Many Requests — try again after {retry_after}s"
-        r.raise_for_status()
-        j = r.json()["current"]
-        df = pd.DataFrame([{
-            "time": pd.to_datetime(j["time"]),
-            "temperature": j["temperature_2m"],
-            "wind": j["wind_speed_10m"],
-        }])
-        return df, None
-    except requests.RequestException as e:
-        return None, f"Network/HTTP error: {e}"
+    """Fetch current weather at every site safely. Returns (df, err_msg), one row per location."""
+    return fetch_current(SITES, http)
 
 # --- Auto Refresh Controls ---
 st.subheader("🔁 Auto Refresh Settings")
 
 # Slider now supports up to 5 minutes (300 seconds)
-refresh_sec = st.slider("Refresh every (sec)", 30, 300, 120)
+refresh_sec = st.slider("Refresh every (sec)", 30, 300, 120, key="refresh_sec")
 
-auto_refresh = st.toggle("Enable auto-refresh", value=False)
+auto_refresh = st.toggle("Enable auto-refresh", value=False, key="auto_refresh")
 manual_refresh = st.button("🔄 Refresh Now")
 
-st.caption(f"Last refreshed at: {time.strftime('%H:%M:%S')}")
+store = get_store()
+
+
+# Downsampled range queries, shared by every viewer. New readings mark them
+# stale; viewers keep the previous frame while one thread requeries.
+@cached_fetch("open-meteo history", ttl=POLL_SEC)
+def stored_history(window):
+    end = pd.Timestamp.now(tz="UTC")
+    frame = store.query("open-meteo", ["temperature", "wind"], end - HISTORY_WINDOWS[window], end, points=CHART_POINTS)
+    return frame, store.count("open-meteo")
+
+
+def poll_weather():
+    """get_weather() for the poller thread; every new featured-site reading is also kept in the history store."""
+    df, err = get_weather()
+    if df is not None:
+        for reading in df[df["location"] == FEATURED].to_dict("records"):
+            store.append("open-meteo", reading["time"], {"temperature": reading["temperature"], "wind": reading["wind"]})
+        stored_history.invalidate()
+    return df, err
+
+
+# One background poller per process fetches the weather; sessions only read its latest snapshot
+poller = get_poller("open-meteo", poll_weather, POLL_SEC)
 
 if manual_refresh:
-    st.cache_data.clear()
+    poller.refresh()
     st.toast("Data manually refreshed.", icon="🔁")
 
 # --- Session History Setup ---
+# Last 200 readings per session, in a preallocated ring buffer
 if "history" not in st.session_state:
-    st.session_state["history"] = pd.DataFrame(columns=["time", "temperature", "wind"])
+    st.session_state["history"] = ReadingBuffer(200, ["temperature", "wind"])
 
 # --- Main View ---
-st.subheader("🌤️ Live Weather Data (Denver)")
-
-df, err = get_weather()
-if err or df is None:
-    st.warning(f"{err}\nShowing sample data so the demo continues.")
-    df = SAMPLE_DF.copy()
-
-# Append new data point to session history
-st.session_state["history"] = pd.concat(
-    [st.session_state["history"], df], ignore_index=True
-)
-
-# Keep last 200 readings
-st.session_state["history"] = st.session_state["history"].tail(200)
-
-# Display latest data and trend
-st.dataframe(df, use_container_width=True)
-
-fig = px.line(
-    st.session_state["history"],
-    x="time",
-    y="temperature",
-    markers=True,
-    title="Live Temperature Over Time (°C)",
-    labels={"temperature": "Temperature (°C)"},
-)
-st.plotly_chart(fig, use_container_width=True)
-
-# --- Auto-refresh logic ---
-if auto_refresh:
-    time.sleep(refresh_sec)
-    st.cache_data.clear()
-    st.rerun()
\ No newline at end of file
+# With auto-refresh on, only this fragment reruns on the timer. The browser
+# schedules the ticks, so no server thread waits in between and the
+# controls above stay responsive.
+@st.fragment(run_every=refresh_sec if auto_refresh else None)
+def live_weather():
+    # Section names carry the page so they stay apart from the Dashboard's in the shared store
+    laps = SectionTimer()
+    snapshot = poller.latest(wait=10)
+    df, err = snapshot.data, snapshot.error
+    # The time of the reading shown, not of this rerun
+    fetched = time.strftime("%H:%M:%S", time.localtime(snapshot.fetched_at)) if snapshot.fetched_at else "never"
+    st.caption(f"Last fetched at: {fetched}")
+    st.subheader(f"🌤️ Live Weather Data ({FEATURED})")
+
+    if df is None:
+        st.warning(f"{err or 'No data fetched yet.'}\nShowing sample data so the demo continues.")
+        df = SAMPLE_DF.copy()
+    elif err:
+        st.warning(f"{err}\nShowing the last reading fetched.")
+
+    featured = df[df["location"] == FEATURED]
+
+    # Append real readings only; one with an already stored timestamp is skipped
+    history = st.session_state["history"]
+    if snapshot.data is not None:
+        for reading in featured.to_dict("records"):
+            history.append(reading["time"], reading)
+    laps.mark("weather: snapshot")
+
+    # Display latest data and trend
+    st.dataframe(featured, use_container_width=True, hide_index=True)
+
+    fig = px.line(
+        history.frame() if len(history) else featured,
+        x="time",
+        y="temperature",
+        markers=True,
+        title="Live Temperature Over Time (°C)",
+        labels={"temperature": "Temperature (°C)"},
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    laps.mark("weather: trend chart")
+
+    # --- All Sites ---
+    st.subheader(f"🗺️ All Sites ({len(df)} of {len(SITES)})")
+    fig_sites = px.bar(
+        df.sort_values("temperature"),
+        x="temperature",
+        y="location",
+        orientation="h",
+        color="wind",
+        title="Current temperature by site (°C), colored by wind (km/h)",
+        labels={"temperature": "Temperature (°C)", "location": "", "wind": "Wind"},
+        height=max(400, 22 * len(df)),
+    )
+    st.plotly_chart(fig_sites, use_container_width=True)
+    st.dataframe(df, use_container_width=True, hide_index=True)
+    laps.mark("weather: all sites")
+
+    # --- Stored History ---
+    # Every featured-site reading the poller has fetched, across sessions and restarts,
+    # downsampled in the store to at most CHART_POINTS per line
+    st.subheader("🗄️ Stored History")
+    window = st.selectbox("Range", list(HISTORY_WINDOWS), key="history_window")
+    stored, stored_count = stored_history(window)
+    if stored.empty:
+        st.info("No stored readings in this range yet.")
+    else:
+        fig_stored = px.line(
+            stored,
+            x="time",
+            y="value",
+            color="name",
+            title=f"{FEATURED} temperature (°C) and wind (km/h), {window.lower()}",
+            labels={"value": "Reading", "name": ""},
+        )
+        st.plotly_chart(fig_stored, use_container_width=True)
+        st.caption(f"{len(stored)} points charted from {stored_count} stored values.")
+    laps.mark("weather: stored history")
+
+
+live_weather()
+
+# Add ?debug=1 to the URL to see section timings, upstream request counts, latency and cache hits
+if debug_enabled():
+    render_debug_panel()
+    render_metrics_panel(http)
+    render_cache_panel(get_fetch_cache())
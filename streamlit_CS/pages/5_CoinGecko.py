@@ -3,6 +3,12 @@ import pandas as pd
 import requests
 import plotly.express as px
 import time
+from utils.fetch_cache import cached_fetch, get_fetch_cache, render_cache_panel
+from utils.http_client import get_client, render_metrics_panel
+from utils.poller import get_poller
+from utils.profiling import SectionTimer, debug_enabled, render_debug_panel
+from utils.ring_buffer import ReadingBuffer
+from utils.timeseries_store import get_store
 
 st.set_page_config(page_title="Live API Demo (Simple)", page_icon="📡", layout="wide")
 # Disable fade/transition so charts don't blink between reruns
@@ -24,7 +30,6 @@ st.caption("Friendly demo with manual refresh + fallback data so it never crashe
 # ---- Config ----
 COINS = ["bitcoin", "ethereum"]
 VS = "usd"
-HEADERS = {"User-Agent": "msudenver-dataviz-class/1.0", "Accept": "application/json"}
 
 
 def build_url(ids):
@@ -37,12 +42,29 @@ API_URL = build_url(COINS)
 SAMPLE_DF = pd.DataFrame([{"coin": "bitcoin", VS: 68000}, {"coin": "ethereum", VS: 3500}])
 
 
-# --- Fetch & cache ---
-@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes
+# Seconds between upstream calls; shared by every viewer in this process
+POLL_SEC = 30
+
+# Stored-history ranges offered on the page, and the most points per line sent to the chart
+HISTORY_WINDOWS = {
+    "Last hour": pd.Timedelta(hours=1),
+    "Last day": pd.Timedelta(days=1),
+    "Last week": pd.Timedelta(weeks=1),
+    "Last 30 days": pd.Timedelta(days=30),
+}
+CHART_POINTS = 800
+
+
+# --- Fetch ---
+# Pooled keep-alive session shared by the live pages; retries 429/5xx and
+# network errors with backoff, honouring Retry-After
+http = get_client()
+
+
 def fetch_prices(url: str):
     """Return (df, error_message). Never raise. Safe for beginners."""
     try:
-        resp = requests.get(url, timeout=10, headers=HEADERS)
+        resp = http.get(url)
         # Handle 429 and other non-200s
         if resp.status_code == 429:
             retry_after = resp.headers.get("Retry-After", "a bit")
@@ -65,41 +87,124 @@ def fetch_prices(url: str):
 st.subheader("🔁 Auto Refresh Settings")
 
 # Let user choose how often to refresh (in seconds)
-refresh_sec = st.slider("Refresh every (sec)", 10, 300, 60)  # up to 5 min if you prefer
+refresh_sec = st.slider("Refresh every (sec)", 10, 300, 60, key="refresh_sec")  # up to 5 min if you prefer
 
 # Toggle to turn automatic refreshing on/off
-auto_refresh = st.checkbox("Enable auto-refresh", value=False)
+auto_refresh = st.checkbox("Enable auto-refresh", value=False, key="auto_refresh")
 
 # Manual refresh button
 manual_refresh = st.button("🔄 Refresh Now")
 
-# Show current refresh time
-st.caption(f"Last refreshed at: {time.strftime('%H:%M:%S')}")
+store = get_store()
 
-if manual_refresh:
-    st.cache_data.clear()
-    st.toast("Data manually refreshed.", icon="🔁")
 
+# Downsampled range queries, shared by every viewer. New readings mark them
+# stale; viewers keep the previous frame while one thread requeries.
+@cached_fetch("coingecko history", ttl=POLL_SEC)
+def stored_history(window):
+    end = pd.Timestamp.now(tz="UTC")
+    frame = store.query("coingecko", COINS, end - HISTORY_WINDOWS[window], end, points=CHART_POINTS)
+    return frame, store.count("coingecko")
+
+
+def poll_prices():
+    """fetch_prices() for the poller thread; every fetch is also kept in the history store."""
+    df, err = fetch_prices(API_URL)
+    if df is not None:
+        store.append("coingecko", pd.Timestamp.now(tz="UTC"), dict(zip(df["coin"], df[VS])))
+        stored_history.invalidate()
+    return df, err
 
-# --- Main View ---
-st.subheader("Prices")
-df, err = fetch_prices(API_URL)
 
-if err or df is None:
-    st.warning(f"{err}\nShowing sample data so the demo continues.")
-    df = SAMPLE_DF.copy()
+# One background poller per process fetches the prices; sessions only read its latest snapshot
+poller = get_poller("coingecko", poll_prices, POLL_SEC)
 
-# Ensure the currency column exists (defensive)
-if VS not in df.columns:
-    df[VS] = None
+if manual_refresh:
+    poller.refresh()
+    st.toast("Data manually refreshed.", icon="🔁")
 
-st.dataframe(df, use_container_width=True)
 
-fig = px.bar(df, x="coin", y=VS, title=f"Current price ({VS.upper()})")
-st.plotly_chart(fig, use_container_width=True)
+# --- Session History Setup ---
+# Last 200 fetched prices per coin for this session, in a preallocated ring buffer
+if "price_history" not in st.session_state:
+    st.session_state["price_history"] = ReadingBuffer(200, COINS)
 
-# If auto-refresh is ON, wait and rerun the app
-if auto_refresh:
-    time.sleep(refresh_sec)
-    st.cache_data.clear()
-    st.rerun()
\ No newline at end of file
+# --- Main View ---
+# With auto-refresh on, only this fragment reruns on the timer. The browser
+# schedules the ticks, so no server thread waits in between and the
+# controls above stay responsive.
+@st.fragment(run_every=refresh_sec if auto_refresh else None)
+def live_prices():
+    # Section names carry the page so they stay apart from the Dashboard's in the shared store
+    laps = SectionTimer()
+    snapshot = poller.latest(wait=10)
+    df, err = snapshot.data, snapshot.error
+
+    # Show when the prices were fetched, not when this rerun happened
+    fetched = time.strftime("%H:%M:%S", time.localtime(snapshot.fetched_at)) if snapshot.fetched_at else "never"
+    st.caption(f"Last fetched at: {fetched}")
+
+    st.subheader("Prices")
+
+    if df is None:
+        st.warning(f"{err or 'No data fetched yet.'}\nShowing sample data so the demo continues.")
+        df = SAMPLE_DF.copy()
+    elif err:
+        st.warning(f"{err}\nShowing the last prices fetched.")
+
+    # Ensure the currency column exists (defensive)
+    if VS not in df.columns:
+        df[VS] = None
+    laps.mark("prices: snapshot")
+
+    st.dataframe(df, use_container_width=True)
+
+    fig = px.bar(df, x="coin", y=VS, title=f"Current price ({VS.upper()})")
+    st.plotly_chart(fig, use_container_width=True)
+
+    # One point per fetch; rereading the same snapshot is skipped by its timestamp
+    history = st.session_state["price_history"]
+    if snapshot.data is not None:
+        prices = dict(zip(snapshot.data["coin"], snapshot.data[VS]))
+        history.append(pd.Timestamp.fromtimestamp(snapshot.fetched_at), prices)
+
+    if len(history) > 1:
+        fig_history = px.line(
+            history.frame(),
+            x="time",
+            y=COINS,
+            markers=True,
+            title=f"Price history this session ({VS.upper()})",
+            labels={"value": VS.upper(), "variable": "coin"},
+        )
+        st.plotly_chart(fig_history, use_container_width=True)
+    laps.mark("prices: charts")
+
+    # --- Stored History ---
+    # Every price the poller has fetched, across sessions and restarts,
+    # downsampled in the store to at most CHART_POINTS per coin
+    window = st.selectbox("Stored history range", list(HISTORY_WINDOWS), key="history_window")
+    stored, stored_count = stored_history(window)
+    if stored.empty:
+        st.info("No stored prices in this range yet.")
+    else:
+        fig_stored = px.line(
+            stored,
+            x="time",
+            y="value",
+            color="name",
+            title=f"Stored price history, {window.lower()} ({VS.upper()})",
+            labels={"value": VS.upper(), "name": "coin"},
+        )
+        st.plotly_chart(fig_stored, use_container_width=True)
+        st.caption(f"{len(stored)} points charted from {stored_count} stored prices.")
+    laps.mark("prices: stored history")
+
+
+live_prices()
+
+# Add ?debug=1 to the URL to see section timings, upstream request counts, latency and cache hits
+if debug_enabled():
+    render_debug_panel()
+    render_metrics_panel(http)
+    render_cache_panel(get_fetch_cache())
@@ -1,22 +1,9 @@
-import plotly.graph_objects as go
 import streamlit as st
-import pandas as pd
-from streamlit_folium import st_folium
-import geopandas as gpd
-import folium
-import plotly.express as px
-import os
+from utils.profiling import SectionTimer, debug_enabled, render_debug_panel, section
 
 # --- Page Setup ---
 st.set_page_config(page_title="Dashboard", layout="wide")
 
-# --- Load Data ---
-data_path = os.path.join(os.path.dirname(__file__), "..", "data", "PandemicChronoTable.csv")
-df = pd.read_csv(data_path)
-
-# Normalize continent names for consistent matching
-df["Continent"] = df["Continent"].str.strip().str.title()
-
 # --- Session State ---
 if "sidebar_open" not in st.session_state:
     st.session_state.sidebar_open = True
@@ -120,6 +107,11 @@ with sidebar_col:
             st.session_state.sidebar_open = False
             st.rerun()
 
+        if st.button("Analytics", use_container_width=True):
+            st.session_state.page = "Analytics"
+            st.session_state.sidebar_open = False
+            st.rerun()
+
         if st.button("About Me", use_container_width=True):
             st.session_state.page = "About Me"
             st.session_state.sidebar_open = False
@@ -128,6 +120,9 @@ with sidebar_col:
         st.write("")  # keeps layout consistent
 
 
+# Insights list entries per page; keeps each rerun's output the same size
+INSIGHTS_PAGE_SIZE = 20
+
 # --- Template Slider State ---
 if "data_template" not in st.session_state:
     st.session_state.data_template = 0  # start at Template 0 (the map view)
@@ -138,40 +133,93 @@ def render_home():
     st.write("Welcome to the Pandemic Dashboard. Explore data and insights about pandemics through history.")
 
 def render_data():
+    # Map, chart and data libraries are only imported once this page is opened
+    import folium
+    from folium.plugins import HeatMap
+    import plotly.express as px
+    import plotly.graph_objects as go
+    from utils.pandemic_data import load_pandemic_data
+    from utils.geo_layers import DEFAULT_CENTER, DEFAULT_ZOOM, event_markers, map_viewport, render_map
+
+    laps = SectionTimer()
+
+    # Parsed once per process and shared by all sessions; reloads when DataEDA rebuilds the file
+    data = load_pandemic_data()
+    laps.mark("data load")
+
     st.title("Data Overview")
 
     # --- Layout ---
     map_col, details_col = st.columns([2, 1])
 
-    # --- Data Prep ---
-    geojson_path = os.path.join(os.path.dirname(__file__), "..", "data", "continents.geojson")
-    
-    required_cols_for_dropna = ["Latitude", "Longitude", "Continent", "Date", "Disease", "Death toll (estimate)"]
-
-    map_df = df[(df["Latitude"] != 0) & (df["Longitude"] != 0)].dropna(
-        subset=required_cols_for_dropna
-    )
-    
-    disease_list = ["Select a Pandemic..."] + sorted(map_df["Disease"].unique().tolist())
-
     # --- Right Column: Details & Controls ---
     with details_col:
         st.subheader("Filters")
-        
+
+        first_year, last_year = data.year_index.bounds
+        year_range = st.slider(
+            "Years active:",
+            min_value=first_year,
+            max_value=last_year,
+            value=(first_year, last_year),
+            key="year_range"
+        )
+
+    disease_list = ["Select a Pandemic..."] + data.diseases_in_years(*year_range)
+
+    with details_col:
+        search_query = st.text_input(
+            "Search events, diseases or places:",
+            placeholder="e.g. cholera india",
+            key="search_query"
+        )
+        search_hits = data.search(search_query) if search_query.strip() else None
+
+        # A row picked in the results table selects its disease, once per pick
+        picked = st.session_state.get("search_results", {}).get("selection", {}).get("rows", [])
+        if search_hits is not None and picked and picked != st.session_state.get("search_applied"):
+            st.session_state.search_applied = picked
+            hit_disease = search_hits.iloc[picked[0]]["Disease"] if picked[0] < len(search_hits) else None
+            if hit_disease in disease_list:
+                st.session_state.disease_selector = hit_disease
+
         selected_disease = st.selectbox(
             "Choose a pandemic to display:",
             options=disease_list,
             key="disease_selector"
         )
-        
+
+        if search_hits is not None:
+            if search_hits.empty:
+                st.caption("No matches.")
+            else:
+                st.dataframe(
+                    search_hits[["Event", "Disease", "Location", "Date"]],
+                    hide_index=True,
+                    on_select="rerun",
+                    selection_mode="single-row",
+                    key="search_results"
+                )
+
+        weight_by_deaths = st.checkbox(
+            "Weight heatmap by estimated deaths",
+            value=False,
+            key="heat_weighted"
+        )
+
+        # Precomputed rows and aggregates for the selection (None until one is chosen)
+        pandemic = None
+        if selected_disease and selected_disease != "Select a Pandemic...":
+            pandemic = data.disease_view(selected_disease, *year_range)
+        laps.mark("filter")
+
         st.markdown("---")
 
         # --- KPI Visuals ---
         st.subheader("Impact Analysis")
 
         if selected_disease and selected_disease != "Select a Pandemic...":
-            pandemic_rows = map_df[map_df["Disease"] == selected_disease]
-            total_deaths = pandemic_rows["Death Toll (est)"].sum()
+            total_deaths = pandemic.total_deaths
             world_population = 8_100_000_000
             percentage_of_world = (total_deaths / world_population) * 100 if world_population > 0 else 0
 
@@ -201,76 +249,65 @@ def render_data():
 
         else:
             st.info("Select a pandemic to see its impact analysis.")
+        laps.mark("kpis")
 
 
     # --- Left Column: Map ---
     with map_col:
         st.subheader("Pandemic Map")
 
-        map_center = [20, 0]
-        zoom_level = 2
+        map_center = DEFAULT_CENTER
+        zoom_level = DEFAULT_ZOOM
         
         if selected_disease and selected_disease != "Select a Pandemic...":
-            pandemic_rows = map_df[map_df["Disease"] == selected_disease]
-            if not pandemic_rows.empty:
-                map_center = [pandemic_rows["Latitude"].mean(), pandemic_rows["Longitude"].mean()]
+            if pandemic.centroid is not None:
+                map_center = list(pandemic.centroid)
                 zoom_level = 3
 
-        m = folium.Map(
-            location=map_center,
-            zoom_start=zoom_level,
-            control_scale=True
-        )
+        # Events inside the viewport the map reported on its last interaction.
+        # The viewport only applies to the selection it was reported for.
+        visible = pandemic
+        view_zoom = zoom_level
+        selection = (selected_disease, tuple(year_range))
+        viewport = map_viewport(st.session_state.get("main_map"))
+        if pandemic is not None and viewport and st.session_state.get("map_selection") == selection:
+            bounds, view_zoom = viewport
+            visible = pandemic.in_view(*bounds)
+        st.session_state.map_selection = selection
 
-        folium.GeoJson(
-            geojson_path,
-            name="continents",
-            style_function=lambda feature: {"fillColor": "#1DB954", "color": "black", "weight": 1, "fillOpacity": 0.1},
-            tooltip=folium.GeoJsonTooltip(
-                fields=["CONTINENT"], 
-                aliases=[""],
-                style=("background-color: #333; color: white; font-family: sans-serif; font-size: 12px; padding: 5px;")
-            )
-        ).add_to(m)
+        # Only this layer changes between reruns; the base map is cached
+        pandemic_layer = folium.FeatureGroup(name="pandemic")
 
         if selected_disease and selected_disease != "Select a Pandemic...":
-            from folium.plugins import HeatMap
-            
-            pandemic_rows = map_df[map_df["Disease"] == selected_disease]
-            
-            if not pandemic_rows.empty:
-                heat_data = pandemic_rows[["Latitude", "Longitude"]].values.tolist()
-                HeatMap(heat_data, radius=25, blur=15).add_to(m)
-
-                for _, row in pandemic_rows.iterrows():
-                    popup_html = f"""
-                    <div style="min-width: 200px;">
-                        <b>Location:</b> {row['Location']}<br>
-                        <b>Time:</b> {row['Date']}<br>
-                        <b>Deaths:</b> {row['Death toll (estimate)']}
-                    </div>
-                    """
-                    folium.Marker(
-                        location=[row["Latitude"], row["Longitude"]],
-                        popup=popup_html,
-                        tooltip=row['Location'],
-                        icon=folium.Icon(color="red", icon="info-sign"),
-                    ).add_to(m)
+            pandemic_rows = visible.rows
+
+            if not pandemic.rows.empty:
+                # Pre-binned cells keep the heatmap payload bounded by the zoom
+                heat_data = visible.heat_cells(view_zoom, weighted=weight_by_deaths)
+                HeatMap(heat_data, radius=25, blur=15).add_to(pandemic_layer)
+
+                event_markers(pandemic_rows).add_to(pandemic_layer)
+                if visible is not pandemic:
+                    st.caption(f"{len(pandemic_rows):,} of {len(pandemic.rows):,} events in view")
             else:
                 st.warning(f"No location data found for {selected_disease}")
 
-        st_folium(m, key="main_map", width=800, height=500)
+        laps.mark("map build")
+
+        # Outline detail follows the zoom the user is at, whatever the selection
+        render_map(
+            pandemic_layer, center=map_center, zoom=zoom_level, view_zoom=viewport[1] if viewport else None,
+            key="main_map", width=800, height=500,
+        )
+        laps.mark("st_folium")
 
     # --- NEW: Bar Chart Section ---
     st.markdown("---") # Divider below the map
     st.subheader("Deaths by Location")
 
     if selected_disease and selected_disease != "Select a Pandemic...":
-        pandemic_rows = map_df[map_df["Disease"] == selected_disease]
-        
-        # Aggregate deaths by location
-        deaths_by_location = pandemic_rows.groupby("Location")["Death Toll (est)"].sum().reset_index()
-        deaths_by_location = deaths_by_location.sort_values(by="Death Toll (est)", ascending=False)
+        # Aggregated once when the data loads, or per viewport once the map has moved
+        deaths_by_location = visible.deaths_by_location
 
         if not deaths_by_location.empty:
             fig_bar = px.bar(
@@ -289,6 +326,7 @@ def render_data():
             st.info(f"No detailed death toll data by location for {selected_disease}.")
     else:
         st.info("Select a pandemic to see the breakdown of deaths by location.")
+    laps.mark("chart build")
 
 
     # --- Insights Section ---
@@ -297,13 +335,29 @@ def render_data():
     
     if selected_disease and selected_disease != "Select a Pandemic...":
         st.markdown(f"**{selected_disease}** affected:")
-        pandemic_rows = map_df[map_df["Disease"] == selected_disease]
-        for _, row in pandemic_rows.iterrows():
-            st.markdown(
-                f"- **Location:** {row['Location']}<br>"
-                f"  **Time:** {row['Date']}<br>"
-                f"  **Deaths:** {row['Death toll (estimate)']}"
+        insight_rows = visible.rows
+        page_count = max(1, -(-len(insight_rows) // INSIGHTS_PAGE_SIZE))
+        page = 1
+        if page_count > 1:
+            # A new selection can have fewer pages than the one last viewed
+            if st.session_state.get("insights_page", 1) > page_count:
+                st.session_state.insights_page = 1
+            page = st.number_input(
+                f"Page (of {page_count}, {len(insight_rows):,} events)",
+                min_value=1,
+                max_value=page_count,
+                key="insights_page"
             )
+        start = (page - 1) * INSIGHTS_PAGE_SIZE
+        page_rows = insight_rows.iloc[start:start + INSIGHTS_PAGE_SIZE]
+
+        # One markdown element per page, built column-wise, instead of one per row
+        items = (
+            "- **Location:** " + page_rows["Location"].astype(str)
+            + "  \n  **Time:** " + page_rows["Date"].astype(str)
+            + "  \n  **Deaths:** " + page_rows["Death toll (estimate)"].astype(str)
+        )
+        st.markdown("\n".join(items))
     else:
         st.write(
             """
@@ -312,6 +366,69 @@ def render_data():
             available data.
             """
         )
+    laps.mark("insights")
+
+def render_analytics():
+    import plotly.express as px
+    from utils.pandemic_data import load_pandemic_data
+
+    laps = SectionTimer()
+    cube = load_pandemic_data().cube
+    laps.mark("data load")
+
+    st.title("Trends Across Pandemics")
+
+    if cube is None or cube.frame.empty:
+        st.info("Aggregates are missing; run `python data/DataEDA.py` to build them.")
+        return
+
+    # Every view below slices the precomputed Disease x Continent x Century cube
+    first_era, last_era = st.select_slider(
+        "Centuries:",
+        options=cube.eras,
+        value=(cube.eras[0], cube.eras[-1]),
+        format_func=lambda era: f"{era}s",
+        key="analytics_eras"
+    )
+
+    st.subheader("Deaths by Continent per Century")
+    by_era = cube.deaths_by_continent_era(first_era, last_era)
+    fig_era = px.bar(
+        by_era,
+        x="Era",
+        y="Deaths",
+        color="Continent",
+        labels={"Era": "Century", "Deaths": "Estimated Deaths"},
+        color_discrete_sequence=px.colors.qualitative.Set1,
+        hover_data=["Events"],
+    )
+    st.plotly_chart(fig_era, use_container_width=True)
+
+    st.markdown("---")
+    st.subheader("Top Diseases by Continent")
+    continent = st.selectbox(
+        "Continent:",
+        options=["All continents"] + cube.continents,
+        key="analytics_continent"
+    )
+    top = cube.top_diseases(first_era, last_era, None if continent == "All continents" else continent)
+    if not top.empty:
+        fig_top = px.bar(
+            top,
+            x="Deaths",
+            y="Disease",
+            orientation="h",
+            labels={"Deaths": "Estimated Deaths"},
+            color_discrete_sequence=px.colors.qualitative.Set1,
+            hover_data=["Events"],
+            height=min(500, 50 * len(top) + 100)
+        )
+        fig_top.update_layout(yaxis={'categoryorder': 'total ascending'})
+        st.plotly_chart(fig_top, use_container_width=True)
+    else:
+        st.info(f"No recorded deaths for {continent} in these centuries.")
+    laps.mark("chart build")
+
 
 def render_about():
     st.title("About Me")
@@ -321,9 +438,15 @@ def render_about():
 page_renderer = {
     "Home": render_home,
     "Data": render_data,
+    "Analytics": render_analytics,
     "About Me": render_about,
 }
 
 # --- Render Selected Page ---
 with main_col:
-    page_renderer[st.session_state.page]()
\ No newline at end of file
+    with section(f"page: {st.session_state.page}"):
+        page_renderer[st.session_state.page]()
+
+    # Opt-in with ?debug=1
+    if debug_enabled():
+        render_debug_panel()
\ No newline at end of file
@@ -0,0 +1 @@
+"""Shared helpers for the Streamlit pages (pages/ only holds page scripts)."""
@@ -0,0 +1,151 @@
+"""Process-wide cache for fetched data, with per-key TTLs and stale-while-revalidate.
+
+Unlike st.cache_data.clear(), invalidation here is scoped: one function,
+or one call of it (say, one URL). An entry past its TTL is still served
+at once while a single background thread refetches it, so viewers never
+wait on a refresh once a value exists. Only the very first read of a key
+fetches in the foreground, and concurrent first reads share that fetch.
+
+    @cached_fetch("prices", ttl=30)
+    def fetch_json(url): ...
+
+    fetch_json(url)              # cached per URL
+    fetch_json.invalidate(url)   # just that URL
+    fetch_json.invalidate()      # every URL of this function
+"""
+import functools
+import threading
+import time
+
+import streamlit as st
+
+
+class _Entry:
+    def __init__(self):
+        self.value = None
+        self.error = None
+        self.expires = 0.0
+        self.ready = threading.Event()  # set once a first value (or error) is in
+        self.refreshing = False
+
+
+class FetchCache:
+    """Entries keyed by (name, args); counters kept per name.
+
+    get() outcomes: "hits" (fresh), "stale" (served old value, refresh
+    started), "misses" (nothing cached, fetched in the foreground).
+    "refreshes" counts background refetches and "errors" failed fetches;
+    a failed refresh keeps serving the previous value.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def _count(self, name, key):
+        counts = self._counts.setdefault(name, {"hits": 0, "stale": 0, "misses": 0, "refreshes": 0, "errors": 0})
+        counts[key] += 1
+
+    def _load(self, key, entry, fetch, ttl):
+        """Run fetch() for an entry and publish the result; never raises."""
+        try:
+            value, error = fetch(), None
+        except Exception as e:
+            value, error = None, e
+        with self._lock:
+            if error is None:
+                entry.value = value
+            else:
+                self._count(key[0], "errors")
+            # After a failure too, so a broken upstream is retried once per TTL, not on every read
+            entry.error = error
+            entry.expires = time.monotonic() + ttl
+            entry.refreshing = False
+        entry.ready.set()
+
+    def get(self, key, fetch, ttl):
+        """Cached value of fetch() for `key`, refetched in the background once older than `ttl` seconds."""
+        name = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+                entry.refreshing = True
+                self._count(name, "misses")
+                first = True
+            else:
+                first = False
+                if not entry.ready.is_set():
+                    self._count(name, "misses")
+                elif time.monotonic() < entry.expires:
+                    self._count(name, "hits")
+                else:
+                    self._count(name, "stale")
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        self._count(name, "refreshes")
+                        threading.Thread(
+                            target=self._load, args=(key, entry, fetch, ttl), name="cache-refresh", daemon=True
+                        ).start()
+        if first:
+            self._load(key, entry, fetch, ttl)
+        entry.ready.wait()
+        if entry.value is None and entry.error is not None:
+            # Nothing good to fall back on; forget the key so the next read retries
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            raise entry.error
+        return entry.value
+
+    def invalidate(self, name, *args):
+        """Mark one call (name, args) stale, or every call of `name` when no args are given.
+
+        Stale entries keep serving their value until the background refetch lands.
+        """
+        with self._lock:
+            for key, entry in self._entries.items():
+                if key[0] == name and (not args or key[1] == args):
+                    entry.expires = 0.0
+
+    def stats(self):
+        """{name: {hits, stale, misses, refreshes, errors}}."""
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._counts.items()}
+
+
+@st.cache_resource(show_spinner=False)
+def get_fetch_cache():
+    """The process-wide FetchCache."""
+    return FetchCache()
+
+
+def cached_fetch(name, ttl):
+    """Decorator: cache a function's results in the shared FetchCache, per argument tuple.
+
+    `name` must be unique in the app; page scripts all run as __main__, so
+    function names alone would collide. The wrapper gains
+    .invalidate(*args) for targeted invalidation.
+    """
+    cache = get_fetch_cache()
+
+    def wrap(fn):
+        @functools.wraps(fn)
+        def cached(*args):
+            return cache.get((name, args), lambda: fn(*args), ttl)
+
+        cached.invalidate = lambda *args: cache.invalidate(name, *args)
+        return cached
+
+    return wrap
+
+
+def render_cache_panel(cache):
+    """Expander with hit/miss counters per cached function."""
+    with st.expander("Fetch cache (debug)", expanded=False):
+        stats = cache.stats()
+        if not stats:
+            st.write("Nothing cached yet.")
+            return
+        st.dataframe([{"function": name, **counts} for name, counts in stats.items()], hide_index=True)
@@ -0,0 +1,194 @@
+"""Map layers for the Dashboard page."""
+import json
+import os
+import threading
+
+import folium
+import streamlit as st
+from branca.element import MacroElement
+from folium.elements import JSCSSMixin
+from folium.plugins import FastMarkerCluster, HeatMap
+from folium.template import Template
+from streamlit_folium import generate_leaflet_string, st_folium
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+# Highest zoom each simplified continents layer is used for; built offline by
+# data/simplify_continents.py. Zooms past the last entry use the source file.
+CONTINENT_LAYERS = [
+    (2, os.path.join(DATA_DIR, "processed", "continents_low.geojson")),
+    (4, os.path.join(DATA_DIR, "processed", "continents_medium.geojson")),
+    (6, os.path.join(DATA_DIR, "processed", "continents_high.geojson")),
+]
+CONTINENTS_SOURCE = os.path.join(DATA_DIR, "continents.geojson")
+
+DEFAULT_CENTER = [20, 0]
+DEFAULT_ZOOM = 2
+
+
+def continents_path(zoom):
+    """Least detailed continents file that still looks right at this zoom."""
+    for max_zoom, path in CONTINENT_LAYERS:
+        if zoom <= max_zoom and os.path.exists(path):
+            return path
+    return CONTINENTS_SOURCE
+
+
+@st.cache_resource(show_spinner=False)
+def _read_geojson(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_continents(zoom):
+    """Parsed continents GeoJSON for a zoom level, read once per process.
+
+    The dict is shared across sessions; folium only reads it because every
+    feature already carries a unique id.
+    """
+    return _read_geojson(continents_path(zoom))
+
+
+class _StaticGeoJson(folium.GeoJson):
+    """GeoJson for layers that never change: bounds and script are computed once.
+
+    st_folium asks the map for its bounds and re-renders it on every call,
+    which otherwise walks and re-serializes every coordinate of the outlines.
+    """
+
+    def _get_self_bounds(self):
+        if not hasattr(self, "_bounds"):
+            self._bounds = super()._get_self_bounds()
+        return self._bounds
+
+    def render(self, **kwargs):
+        # The rendered script stays attached to the cached figure; skip re-serializing
+        if not getattr(self, "_rendered", False):
+            super().render(**kwargs)
+            self._rendered = True
+
+
+class _PluginAssets(JSCSSMixin, MacroElement):
+    """Loads the heatmap and cluster plugins with the base map so dynamic layers can use them."""
+
+    default_js = HeatMap.default_js + FastMarkerCluster.default_js
+    default_css = FastMarkerCluster.default_css
+    _template = Template("")
+
+
+# Builds one marker per data row in the browser. Rows are
+# [lat, lon, location, date, deaths]; the icon is shared by all markers and
+# popups are only assembled when opened.
+_MARKER_CALLBACK = """(function () {
+    var icon = L.AwesomeMarkers.icon({icon: "info-sign", markerColor: "red", prefix: "glyphicon"});
+    return function (row) {
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+        marker.bindPopup(function () {
+            return '<div style="min-width: 200px;"><b>Location:</b> ' + row[2]
+                + '<br><b>Time:</b> ' + row[3] + '<br><b>Deaths:</b> ' + row[4] + '</div>';
+        });
+        marker.bindTooltip(row[2]);
+        return marker;
+    };
+})()"""
+
+
+class _EventMarkers(FastMarkerCluster):
+    """FastMarkerCluster that takes ready-made rows instead of validating each one."""
+
+    def __init__(self, data, **kwargs):
+        super().__init__([], callback=_MARKER_CALLBACK, **kwargs)
+        self.data = data
+
+
+def event_markers(rows):
+    """Clustered markers for pandemic rows, built column-wise.
+
+    Only the popup fields are shipped, one column at a time; markers and
+    their popup HTML are created client-side, so the cost grows with the
+    size of the data rather than the number of folium objects.
+    """
+    rows = rows.dropna(subset=["Latitude", "Longitude"])
+    # Five decimals is ~1 m, plenty for a marker and much shorter than float32 noise
+    columns = [
+        rows["Latitude"].to_numpy(dtype=float).round(5).tolist(),
+        rows["Longitude"].to_numpy(dtype=float).round(5).tolist(),
+        rows["Location"].astype(str).tolist(),
+        rows["Date"].astype(str).tolist(),
+        rows["Death toll (estimate)"].astype(str).tolist(),
+    ]
+    return _EventMarkers(list(zip(*columns)), name="events")
+
+
+@st.cache_resource(show_spinner=False)
+def _outline_layer(path):
+    """Feature group holding one continents file, built once per process and file."""
+    layer = folium.FeatureGroup(name="continents")
+    _StaticGeoJson(
+        _read_geojson(path),
+        name="continents",
+        style_function=lambda feature: {"fillColor": "#1DB954", "color": "black", "weight": 1, "fillOpacity": 0.1},
+        tooltip=folium.GeoJsonTooltip(
+            fields=["CONTINENT"],
+            aliases=[""],
+            style=("background-color: #333; color: white; font-family: sans-serif; font-size: 12px; padding: 5px;")
+        )
+    ).add_to(layer)
+    return layer
+
+
+@st.cache_resource(show_spinner=False)
+def _base_map():
+    """Tiles and plugin scripts, built once per process.
+
+    The continent outlines are not part of it: their detail follows the
+    zoom the user is at, so they travel with the dynamic layers instead.
+    Keeping this map identical across zooms means the browser never
+    remounts it.
+    """
+    m = folium.Map(location=DEFAULT_CENTER, zoom_start=DEFAULT_ZOOM, control_scale=True)
+    _PluginAssets().add_to(m)
+    # Render once up front; st_folium(render=False) reuses the page skeleton.
+    # Generating the Leaflet script also attaches the layers to the map for
+    # good, so every later call produces the same script.
+    m.get_root().render()
+    generate_leaflet_string(m)
+    # st_folium renders and temporarily attaches layers to the map, so calls are serialized
+    return m, threading.Lock()
+
+
+def map_viewport(state):
+    """((south, west, north, east), zoom) from an st_folium return value, or None.
+
+    Longitudes are returned as Leaflet reports them, possibly past +/-180.
+    """
+    if not state or not state.get("bounds") or state.get("zoom") is None:
+        return None
+    south_west = state["bounds"].get("_southWest") or {}
+    north_east = state["bounds"].get("_northEast") or {}
+    corners = (south_west.get("lat"), south_west.get("lng"), north_east.get("lat"), north_east.get("lng"))
+    if any(value is None for value in corners):
+        return None
+    return corners, int(state["zoom"])
+
+
+def render_map(layer, center, zoom, view_zoom=None, **kwargs):
+    """Show the cached base map with continent outlines and `layer` as its per-rerun content.
+
+    The base map's script is identical on every rerun, so st_folium keeps
+    the existing Leaflet map in the browser and only swaps the feature
+    groups, center and zoom. Outline detail is picked for `view_zoom`, the
+    zoom the map last reported (map_viewport), falling back to `zoom`.
+    Extra kwargs go to st_folium.
+    """
+    m, lock = _base_map()
+    layers = [_outline_layer(continents_path(zoom if view_zoom is None else view_zoom)), layer]
+    with lock:
+        try:
+            return st_folium(
+                m, center=center, zoom=zoom, feature_group_to_add=layers, render=False, **kwargs
+            )
+        finally:
+            # st_folium adds the feature groups to the map; keep the cached base clean
+            for added in layers:
+                m._children.pop(added.get_name(), None)
@@ -0,0 +1,135 @@
+"""Shared HTTP client for the live-data pages.
+
+One pooled requests.Session per process keeps connections to each API
+open between fetches instead of reconnecting every time. A semaphore
+caps how many requests are in flight at once. Transient failures
+(connection errors, timeouts, 429 and 5xx) are retried with jittered
+exponential backoff, or after the server's Retry-After when it sends one.
+Latency and error counts are kept per host.
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+
+from utils.profiling import SectionTimings
+
+HEADERS = {"User-Agent": "msudenver-dataviz-class/1.0", "Accept": "application/json"}
+
+# Statuses worth another try; anything else is returned to the caller as is
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def retry_after(resp):
+    """Seconds the server asked us to wait (Retry-After as seconds or an HTTP date), or None."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpClient:
+    """Pooled, retrying GET client with per-host metrics. Safe to share between threads.
+
+    get() sends up to 1 + `retries` attempts. Between attempts it sleeps for
+    Retry-After if given, else a random time in [0, backoff * 2**attempt]
+    ("full jitter", so clients that failed together do not retry together).
+    No wait is longer than `max_wait`: a server asking for more gets its
+    429 returned right away rather than blocking the fetch. The last
+    response is returned even if it is an error status, and the last
+    exception re-raised, so callers keep their own status handling.
+    """
+
+    def __init__(self, headers=HEADERS, pool_size=10, max_concurrent=8, retries=3,
+                 backoff=0.5, max_wait=30, timeout=10):
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_wait = max_wait
+        self.timeout = timeout
+        self.latency = SectionTimings()
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def _count(self, host, key):
+        with self._lock:
+            counts = self._counts.setdefault(host, {"requests": 0, "errors": 0, "retries": 0})
+            counts[key] += 1
+
+    def _attempt(self, host, url, kwargs):
+        """One request inside a concurrency slot; records its latency and outcome."""
+        with self._slots:
+            start = time.perf_counter()
+            self._count(host, "requests")
+            try:
+                resp = self.session.get(url, **kwargs)
+            except requests.RequestException:
+                self._count(host, "errors")
+                raise
+            finally:
+                self.latency.record(host, time.perf_counter() - start)
+        if resp.status_code >= 400:
+            self._count(host, "errors")
+        return resp
+
+    def get(self, url, **kwargs):
+        """requests.get() through the shared pool, with retries. Takes the same arguments."""
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).netloc
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                resp = self._attempt(host, url, kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if last:
+                    raise
+                wait = None
+            else:
+                if resp.status_code not in RETRY_STATUSES or last:
+                    return resp
+                wait = retry_after(resp)
+                if wait is not None and wait > self.max_wait:
+                    return resp
+                resp.close()
+            if wait is None:
+                wait = random.uniform(0, min(self.max_wait, self.backoff * 2 ** attempt))
+            self._count(host, "retries")
+            time.sleep(wait)
+
+    def metrics(self):
+        """{host: {requests, errors, retries, count, last_ms, p50_ms, ...}}."""
+        with self._lock:
+            counts = {host: dict(values) for host, values in self._counts.items()}
+        latency = self.latency.summary()
+        return {host: {**counts[host], **latency.get(host, {})} for host in counts}
+
+
+@st.cache_resource(show_spinner=False)
+def get_client():
+    """The process-wide HttpClient."""
+    return HttpClient()
+
+
+def render_metrics_panel(client):
+    """Expander with request, retry and latency figures per upstream host."""
+    with st.expander("Upstream requests (debug)", expanded=False):
+        metrics = client.metrics()
+        if not metrics:
+            st.write("No requests sent yet.")
+            return
+        st.dataframe([{"host": host, **stats} for host, stats in metrics.items()], hide_index=True)
@@ -0,0 +1,197 @@
+"""Process-wide loader for the processed pandemic table used by the Dashboard page."""
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.search import SearchIndex
+from utils.spatial import GridIndex, cell_degrees, hex_bin
+
+# Built by data/DataEDA.py from the raw PandemicChronoTable.csv; dtypes
+# (categoricals, float32 coordinates) and continent names come pre-normalized
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "processed", "pandemic_events.parquet")
+# Disease x Continent x Era aggregates written by the same build, just before the table
+CUBE_PATH = os.path.join(os.path.dirname(DATA_PATH), "pandemic_cube.parquet")
+
+REQUIRED_MAP_COLUMNS = ["Latitude", "Longitude", "Continent", "Date", "Disease", "Death toll (estimate)"]
+
+
+class YearIndex:
+    """Event date ranges as a closed IntervalIndex, sorted by start year.
+
+    An event overlaps [lo, hi] when start <= hi and end >= lo. No interval
+    is longer than max_span, so every match starts inside
+    [lo - max_span, hi]: two binary searches find that window and only its
+    rows are checked, instead of scanning the whole frame.
+    """
+
+    def __init__(self, frame):
+        dated = frame.dropna(subset=["start_year", "end_year"])
+        # Tables built before DataEDA dropped reversed ranges may still hold some
+        starts = np.minimum(dated["start_year"].astype(int), dated["end_year"].astype(int))
+        ends = np.maximum(dated["start_year"].astype(int), dated["end_year"].astype(int))
+        order = np.argsort(starts.to_numpy(), kind="stable")
+        dated = dated.iloc[order]
+        self.intervals = pd.IntervalIndex.from_arrays(
+            starts.to_numpy()[order], ends.to_numpy()[order], closed="both"
+        )
+        self.labels = dated.index.to_numpy()
+        self._starts = self.intervals.left.to_numpy()
+        self._ends = self.intervals.right.to_numpy()
+        self.max_span = int((self._ends - self._starts).max()) if len(dated) else 0
+        self.bounds = (int(self._starts.min()), int(self._ends.max())) if len(dated) else (0, 0)
+
+    def overlapping(self, lo, hi):
+        """Row labels of events whose date range overlaps [lo, hi], in frame order."""
+        left = np.searchsorted(self._starts, lo - self.max_span, side="left")
+        right = np.searchsorted(self._starts, hi, side="right")
+        hits = self._ends[left:right] >= lo
+        return np.sort(self.labels[left:right][hits])
+
+
+class DiseaseSummary:
+    """One disease's event rows and the aggregates the Dashboard shows for it."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.total_deaths = rows["Death Toll (est)"].sum()
+        self.centroid = (float(rows["Latitude"].mean()), float(rows["Longitude"].mean())) if len(rows) else None
+        self.deaths_by_location = (
+            rows.groupby("Location", observed=True)["Death Toll (est)"].sum()
+            .reset_index()
+            .sort_values(by="Death Toll (est)", ascending=False)
+        )
+        self._heat_cells = {}
+        self.grid = GridIndex(rows["Latitude"], rows["Longitude"])
+
+    def in_view(self, south, west, north, east):
+        """DiseaseSummary of just the events inside a map viewport, found via the grid index."""
+        positions = self.grid.query(south, west, north, east)
+        if len(positions) == len(self.rows):
+            return self
+        return DiseaseSummary(self.rows.iloc[positions])
+
+    def heat_cells(self, zoom, weighted=False):
+        """[lat, lon, intensity] per hexagon for the heatmap at this zoom.
+
+        Events are binned into screen-sized hexagons, optionally weighted by
+        Death Toll (est), and scaled so the strongest cell is 1. The cell
+        count is bounded by the zoom, not the number of events. Results are
+        kept per (zoom, weighted) on the summary, which is itself cached.
+        """
+        key = (zoom, weighted)
+        if key not in self._heat_cells:
+            weights = self.rows["Death Toll (est)"] if weighted else None
+            lat, lon, totals = hex_bin(self.rows["Latitude"], self.rows["Longitude"], weights, cell_degrees(zoom))
+            if len(totals) and totals.max() > 0:
+                totals = totals / totals.max()
+            self._heat_cells[key] = np.column_stack([lat.round(4), lon.round(4), totals.round(4)]).tolist()
+        return self._heat_cells[key]
+
+
+class AggregateCube:
+    """Deaths and event counts per Disease x Continent x Era (century), precomputed by DataEDA.
+
+    Its size depends on how many diseases, continents and centuries there
+    are, not on the number of events, so every slice costs the same
+    whatever the size of the table.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame.astype({"Disease": str, "Continent": str})
+        self.eras = sorted(self.frame["Era"].unique().tolist())
+        self.continents = sorted(self.frame["Continent"].unique().tolist())
+
+    def _eras(self, first_era, last_era):
+        era = self.frame["Era"]
+        return self.frame[(era >= first_era) & (era <= last_era)]
+
+    def deaths_by_continent_era(self, first_era, last_era):
+        """Long frame of Era, Continent, Deaths, Events for eras in [first_era, last_era]."""
+        return (
+            self._eras(first_era, last_era)
+            .groupby(["Era", "Continent"], as_index=False)[["Deaths", "Events"]].sum()
+        )
+
+    def top_diseases(self, first_era, last_era, continent=None, n=10):
+        """The n diseases with the most deaths in those eras, optionally on one continent."""
+        cells = self._eras(first_era, last_era)
+        if continent is not None:
+            cells = cells[cells["Continent"] == continent]
+        return (
+            cells.groupby("Disease", as_index=False)[["Deaths", "Events"]].sum()
+            .nlargest(n, "Deaths")
+        )
+
+
+class PandemicData:
+    """The processed table plus everything the Dashboard derives from it.
+
+    One instance is shared by every session in the process, so treat the
+    frames as read-only.
+    """
+
+    def __init__(self, df, signature, cube=None):
+        self.df = df
+        self.signature = signature
+        # None when the processed data predates the cube; rerun DataEDA to add it
+        self.cube = cube
+        # Events with usable coordinates and details for the map view
+        self.map_df = df[(df["Latitude"] != 0) & (df["Longitude"] != 0)].dropna(
+            subset=REQUIRED_MAP_COLUMNS
+        )
+        self.year_index = YearIndex(self.map_df)
+        # Partition index: each disease's rows and aggregates, so selecting one is a dict lookup
+        self.by_disease = {
+            disease: DiseaseSummary(rows)
+            for disease, rows in self.map_df.groupby("Disease", observed=True, sort=True)
+        }
+        self.disease_list = list(self.by_disease)
+        # Word index over Event, Disease and Location; search results are map_df positions
+        self.search_index = SearchIndex(self.map_df)
+
+    def search(self, query, limit=20):
+        """Map rows matching a typeahead query, best match first."""
+        return self.map_df.iloc[self.search_index.search(query, limit)]
+
+    def diseases_in_years(self, lo, hi):
+        """Sorted diseases with at least one event overlapping [lo, hi]."""
+        if (lo, hi) == self.year_index.bounds:
+            return self.disease_list
+        labels = self.year_index.overlapping(lo, hi)
+        return sorted(self.map_df.loc[labels, "Disease"].unique().tolist())
+
+    def disease_view(self, disease, lo, hi):
+        """DiseaseSummary for a disease, limited to events overlapping [lo, hi].
+
+        The full year range returns the precomputed summary; a narrower range
+        only filters that disease's own rows.
+        """
+        summary = self.by_disease.get(disease)
+        if summary is None or (lo, hi) == self.year_index.bounds:
+            return summary
+        rows = summary.rows
+        return DiseaseSummary(rows[(rows["start_year"] <= hi) & (rows["end_year"] >= lo)])
+
+
+def file_signature(path):
+    """(mtime, size, inode): DataEDA replaces the file atomically, so any rebuild changes it."""
+    info = os.stat(path)
+    return (info.st_mtime_ns, info.st_size, info.st_ino)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load(path, signature):
+    cube_path = os.path.join(os.path.dirname(path), os.path.basename(CUBE_PATH))
+    cube = AggregateCube(pd.read_parquet(cube_path, memory_map=True)) if os.path.exists(cube_path) else None
+    return PandemicData(pd.read_parquet(path, memory_map=True), signature, cube)
+
+
+def load_pandemic_data(path=DATA_PATH):
+    """Return the shared PandemicData, parsing the file only when it changed on disk.
+
+    A stat() per rerun is the only file access on the hot path; a new
+    signature misses the cache and evicts the previous entry.
+    """
+    return _load(path, file_signature(path))
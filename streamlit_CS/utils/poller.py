@@ -0,0 +1,107 @@
+"""Process-wide background pollers for the live pages.
+
+One Poller per upstream endpoint fetches on a fixed schedule and publishes
+the latest Snapshot; sessions only read it. Upstream traffic therefore
+depends on the poll interval, not on how many people have the page open.
+"""
+import threading
+import time
+
+import streamlit as st
+
+
+class Snapshot:
+    """The latest fetch: data from the last success, plus the error of the last attempt if it failed."""
+
+    def __init__(self, data=None, error=None, fetched_at=None, version=0):
+        self.data = data
+        self.error = error
+        self.fetched_at = fetched_at
+        self.version = version
+
+
+class Poller:
+    """Calls fetch() every `interval` seconds on a daemon thread.
+
+    fetch() returns (data, error_message), like the pages' fetch helpers.
+    A failed fetch, or one that raises, keeps the previous data and records
+    the error; the thread carries on at the next tick. Polling
+    pauses once nobody has read the snapshot for `idle_after` seconds and
+    resumes on the next read, so an unwatched page costs nothing.
+    """
+
+    def __init__(self, fetch, interval, idle_after=600):
+        self.fetch = fetch
+        self.interval = interval
+        self.idle_after = idle_after
+        self.fetch_count = 0
+        self._snapshot = Snapshot()
+        self._last_read = time.monotonic()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._updated = threading.Condition(self._lock)
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="poller", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped:
+            if time.monotonic() - self._last_read <= self.idle_after:
+                self._poll_once()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _poll_once(self):
+        try:
+            data, error = self.fetch()
+        except Exception as e:
+            # This thread serves every session for the life of the process; never let it die
+            data, error = None, f"{type(e).__name__}: {e}"
+        with self._lock:
+            previous = self._snapshot
+            self.fetch_count += 1
+            self._snapshot = Snapshot(
+                data=previous.data if data is None else data,
+                error=error,
+                fetched_at=time.time() if data is not None else previous.fetched_at,
+                version=previous.version + 1,
+            )
+            self._updated.notify_all()
+
+    def latest(self, wait=0):
+        """Current snapshot; waits up to `wait` seconds if nothing has been fetched yet.
+
+        The first read after an idle pause also waits for the fetch it
+        triggers, so a returning viewer does not get a reading from before
+        the pause.
+        """
+        was_idle = time.monotonic() - self._last_read > self.idle_after
+        self._last_read = time.monotonic()
+        with self._lock:
+            version = self._snapshot.version
+            if was_idle:
+                self._wake.set()
+            if wait and (was_idle or version == 0):
+                self._updated.wait_for(lambda: self._snapshot.version > version, timeout=wait)
+            return self._snapshot
+
+    def refresh(self, wait=10):
+        """Fetch now instead of at the next tick; waits up to `wait` seconds for the result."""
+        with self._lock:
+            version = self._snapshot.version
+        self._last_read = time.monotonic()
+        self._wake.set()
+        with self._lock:
+            self._updated.wait_for(lambda: self._snapshot.version > version, timeout=wait)
+            return self._snapshot
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+        self._thread.join()
+
+
+@st.cache_resource(show_spinner=False)
+def get_poller(name, _fetch, interval):
+    """The shared Poller for `name`, started on first use and reused by every session."""
+    return Poller(_fetch, interval)
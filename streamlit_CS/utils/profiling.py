@@ -0,0 +1,115 @@
+"""Named section timings for page reruns, kept per process with rolling percentiles.
+
+Wrap a block in `with section("map build"):`, or call `laps.mark(name)`
+on a SectionTimer at the end of each step of a flat script, and the
+duration is added to the shared store. render_debug_panel() shows the
+percentiles and offers them as JSON; pages only call it when debugging
+is switched on.
+"""
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import streamlit as st
+
+# Samples kept per section; older ones roll off so the numbers follow recent load
+WINDOW = 500
+PERCENTILES = (50, 90, 99)
+
+
+def _percentile(ordered, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+class SectionTimings:
+    """Rolling window of durations for each named section, shared across sessions."""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            if name not in self._samples:
+                self._samples[name] = deque(maxlen=self.window)
+            self._samples[name].append(seconds)
+
+    def summary(self):
+        """{section: {count, last_ms, p50_ms, ...}} in the order sections were first seen."""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        result = {}
+        for name, values in samples.items():
+            ordered = sorted(values)
+            stats = {"count": len(values), "last_ms": round(values[-1] * 1000, 2)}
+            for pct in PERCENTILES:
+                stats[f"p{pct}_ms"] = round(_percentile(ordered, pct) * 1000, 2)
+            result[name] = stats
+        return result
+
+    def to_json(self):
+        return json.dumps({"window": self.window, "sections": self.summary()}, indent=2)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+
+@st.cache_resource(show_spinner=False)
+def get_timings():
+    """The process-wide SectionTimings store."""
+    return SectionTimings()
+
+
+@contextmanager
+def section(name):
+    """Time the enclosed block and record it under `name`, even if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        get_timings().record(name, time.perf_counter() - start)
+
+
+class SectionTimer:
+    """Consecutive sections of one rerun: mark(name) records the time since the previous mark."""
+
+    def __init__(self):
+        self._last = time.perf_counter()
+
+    def mark(self, name):
+        now = time.perf_counter()
+        get_timings().record(name, now - self._last)
+        self._last = now
+
+
+def debug_enabled():
+    """Opt-in switch: add ?debug=1 to the page URL."""
+    return st.query_params.get("debug") == "1"
+
+
+def render_debug_panel():
+    """Expander with rolling section percentiles and a JSON download."""
+    timings = get_timings()
+    with st.expander("Render timings (debug)", expanded=False):
+        summary = timings.summary()
+        if not summary:
+            st.write("No sections recorded yet.")
+            return
+        st.dataframe(
+            [{"section": name, **stats} for name, stats in summary.items()],
+            hide_index=True,
+        )
+        st.download_button(
+            "Download timings (JSON)",
+            data=timings.to_json(),
+            file_name="render_timings.json",
+            mime="application/json",
+        )
+        if st.button("Reset timings"):
+            timings.clear()
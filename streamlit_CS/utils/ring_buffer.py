@@ -0,0 +1,60 @@
+"""Fixed-size history of timestamped numeric readings for the live pages."""
+import numpy as np
+import pandas as pd
+
+
+class ReadingBuffer:
+    """Ring buffer of the last `capacity` readings, each a timestamp plus one float per field.
+
+    Storage is preallocated at twice the capacity and every reading is
+    written to slot i and slot i + capacity. The newest `capacity` readings
+    are then always one contiguous slice, so view() is a zero-copy window
+    and append() stays O(1): no concat, no tail(), no reallocation.
+
+    A reading whose timestamp equals the newest one is dropped, so
+    appending the same cached value on every rerun does not repeat it.
+    """
+
+    def __init__(self, capacity, fields):
+        self.capacity = capacity
+        self.fields = list(fields)
+        self._times = np.zeros(2 * capacity, dtype="datetime64[ns]")
+        self._values = np.full((2 * capacity, len(self.fields)), np.nan)
+        self._next = 0  # slot the next reading goes to, in [0, capacity)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def last_time(self):
+        return self._times[self._next + self.capacity - 1] if self._size else None
+
+    def append(self, time, values):
+        """Add a reading; `values` maps field name to number. Returns False for a duplicate timestamp."""
+        time = np.datetime64(pd.Timestamp(time).as_unit("ns").asm8)
+        if self._size and time == self.last_time:
+            return False
+        row = [values.get(field, np.nan) for field in self.fields]
+        for slot in (self._next, self._next + self.capacity):
+            self._times[slot] = time
+            self._values[slot] = row
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return True
+
+    def view(self):
+        """(times, values) for the stored readings, oldest first, as views into the buffer.
+
+        Use them before the next append, which can overwrite the window.
+        """
+        end = self._next + self.capacity
+        return self._times[end - self._size:end], self._values[end - self._size:end]
+
+    def frame(self, time_column="time"):
+        """DataFrame over view() for charting; columns reference the buffer without copying."""
+        times, values = self.view()
+        columns = {time_column: times}
+        for i, field in enumerate(self.fields):
+            columns[field] = values[:, i]
+        return pd.DataFrame(columns, copy=False)
@@ -0,0 +1,88 @@
+"""Typeahead search over the pandemic table: an inverted index with prefix matching."""
+import bisect
+import re
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+")
+# Field weights for ranking: a hit in the event name counts most
+SEARCH_FIELDS = {"Event": 3.0, "Disease": 2.0, "Location": 1.0}
+# A query word that is only the start of an indexed word scores this fraction of a full match
+PREFIX_FACTOR = 0.6
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def _best_per_row(positions, scores):
+    """Sorted unique positions, each with the highest score it appears with."""
+    order = np.lexsort((-scores, positions))
+    positions, scores = positions[order], scores[order]
+    first = np.r_[True, positions[1:] != positions[:-1]]
+    return positions[first], scores[first]
+
+
+class SearchIndex:
+    """Inverted index from lower-cased words to the rows (positions) that contain them.
+
+    Built once per table. Every query word is treated as a prefix: the
+    sorted vocabulary gives the range of words that start with it by
+    binary search, and only their posting lists are read. A row must match
+    every query word; its score adds up the best field weight per word, so
+    event-name and whole-word hits rank first.
+    """
+
+    def __init__(self, frame, fields=SEARCH_FIELDS):
+        self.size = len(frame)
+        parts = {}
+        for column, weight in fields.items():
+            # Tokenize each distinct value once; rows sharing a value are one slice of `order`
+            codes, uniques = frame[column].factorize()
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            for code, value in enumerate(uniques):
+                rows = order[bounds[code]:bounds[code + 1]]
+                for token in set(tokenize(value)):
+                    parts.setdefault(token, []).append((rows, weight))
+        self.vocabulary = sorted(parts)
+        self.positions = []
+        self.weights = []
+        for token in self.vocabulary:
+            positions, weights = _best_per_row(
+                np.concatenate([rows for rows, _ in parts[token]]),
+                np.concatenate([np.full(len(rows), weight) for rows, weight in parts[token]]),
+            )
+            self.positions.append(positions)
+            self.weights.append(weights)
+
+    def _match(self, word):
+        """(positions, scores) of rows containing a word that starts with `word`."""
+        lo = bisect.bisect_left(self.vocabulary, word)
+        hi = bisect.bisect_left(self.vocabulary, word + "\U0010ffff")
+        if lo == hi:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        positions = np.concatenate(self.positions[lo:hi])
+        scores = np.concatenate([
+            weights if self.vocabulary[i] == word else weights * PREFIX_FACTOR
+            for i, weights in zip(range(lo, hi), self.weights[lo:hi])
+        ])
+        # A row can hold several words with this prefix; keep its best score
+        return _best_per_row(positions, scores)
+
+    def search(self, query, limit=None):
+        """Row positions matching every word of `query`, best first (ties in table order)."""
+        words = tokenize(query)
+        if not words:
+            return np.empty(0, dtype=np.int64)
+        positions, scores = self._match(words[0])
+        for word in words[1:]:
+            if not len(positions):
+                break
+            more_positions, more_scores = self._match(word)
+            positions, left, right = np.intersect1d(
+                positions, more_positions, assume_unique=True, return_indices=True
+            )
+            scores = scores[left] + more_scores[right]
+        ranked = positions[np.lexsort((positions, -scores))]
+        return ranked[:limit] if limit is not None else ranked
@@ -0,0 +1,131 @@
+"""Spatial helpers for the Dashboard map: hexagonal binning and a viewport grid index."""
+import numpy as np
+
+# Leaflet tiles are 256 px wide at zoom 0 and double with each zoom level
+TILE_SIZE = 256
+# Hexagon width on screen; about the heatmap radius so cells blend the same way points did
+HEAT_CELL_PX = 20
+MAX_LATITUDE = 85.0511  # Web Mercator cutoff
+# Packs a (row, col) cell into one int64; both fit easily even for tiny cells
+_KEY_OFFSET = 2 ** 30
+_KEY_STRIDE = 2 ** 31
+
+
+def mercator_y(lat):
+    """Latitude in degrees to Web Mercator y, also in degrees, so x and y share a scale."""
+    lat = np.radians(np.clip(lat, -MAX_LATITUDE, MAX_LATITUDE))
+    return np.degrees(np.log(np.tan(np.pi / 4 + lat / 2)))
+
+
+def mercator_lat(y):
+    return np.degrees(2 * np.arctan(np.exp(np.radians(y))) - np.pi / 2)
+
+
+def cell_degrees(zoom, cell_px=HEAT_CELL_PX):
+    """Width in degrees of longitude of a cell that is cell_px wide at this zoom."""
+    return cell_px * 360.0 / (TILE_SIZE * 2 ** zoom)
+
+
+def hex_bin(lat, lon, weights=None, size=1.0):
+    """Bin points into pointy-top hexagons `size` degrees wide on the Mercator plane.
+
+    Every point goes to the nearer center of two offset rectangular grids
+    (the d3-hexbin construction), which is exactly its hexagon. Returns
+    (lat, lon, total) arrays, one entry per non-empty cell; totals are point
+    counts, or weight sums when weights are given.
+    """
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    if weights is None:
+        weights = np.ones(len(lat))
+    weights = np.asarray(weights, dtype=float)
+    if not len(lat):
+        empty = np.empty(0)
+        return empty, empty, empty
+
+    dx = size
+    dy = size * np.sqrt(3) / 2  # row spacing
+    px = lon / dx
+    py = mercator_y(lat) / dy
+
+    # Even rows sit on the integer grid, odd rows are shifted half a cell
+    row = np.round(py)
+    col = np.round(px - (row % 2) / 2)
+    alt_row = np.where(py >= row, row + 1, row - 1)
+    alt_col = np.round(px - (alt_row % 2) / 2)
+    # Compare squared distances in units where hexagons are regular
+    d = (px - col - (row % 2) / 2) ** 2 + ((py - row) * np.sqrt(3) / 2) ** 2
+    d_alt = (px - alt_col - (alt_row % 2) / 2) ** 2 + ((py - alt_row) * np.sqrt(3) / 2) ** 2
+    use_alt = d_alt < d
+    row = np.where(use_alt, alt_row, row).astype(np.int64)
+    col = np.where(use_alt, alt_col, col).astype(np.int64)
+
+    # One int64 key per cell; a 1-D unique is much cheaper than unique over rows
+    keys = (row + _KEY_OFFSET) * _KEY_STRIDE + (col + _KEY_OFFSET)
+    cells, inverse = np.unique(keys, return_inverse=True)
+    totals = np.bincount(inverse, weights=weights, minlength=len(cells))
+    cell_row = cells // _KEY_STRIDE - _KEY_OFFSET
+    cell_col = cells % _KEY_STRIDE - _KEY_OFFSET
+    center_lon = (cell_col + (cell_row % 2) / 2) * dx
+    center_lat = mercator_lat(cell_row * dy)
+    keep = totals > 0
+    return center_lat[keep], center_lon[keep], totals[keep]
+
+
+class GridIndex:
+    """Uniform lat/lon grid over a set of points for bounding-box queries.
+
+    Points are sorted by cell so each grid row of a query box is one
+    contiguous run, found with two binary searches; only the points in
+    those runs are checked exactly. Returns positions, not labels.
+    """
+
+    def __init__(self, lat, lon, cell=2.0):
+        self.lat = np.asarray(lat, dtype=float)
+        self.lon = np.asarray(lon, dtype=float)
+        self.cell = cell
+        self.n_rows = int(np.ceil(180 / cell)) + 1
+        self.n_cols = int(np.ceil(360 / cell)) + 1
+        keys = self._row(self.lat) * self.n_cols + self._col(self.lon)
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def _row(self, lat):
+        return np.clip(np.floor((np.asarray(lat) + 90) / self.cell), 0, self.n_rows - 1).astype(np.int64)
+
+    def _col(self, lon):
+        return np.clip(np.floor((np.asarray(lon) + 180) / self.cell), 0, self.n_cols - 1).astype(np.int64)
+
+    def _query(self, south, west, north, east):
+        r0, r1 = self._row(south), self._row(north)
+        c0, c1 = self._col(west), self._col(east)
+        starts = np.arange(r0, r1 + 1) * self.n_cols
+        lo = np.searchsorted(self.keys, starts + c0, side="left")
+        hi = np.searchsorted(self.keys, starts + c1, side="right")
+        if not len(lo):
+            return np.empty(0, dtype=np.int64)
+        if (hi - lo).sum() > len(self.keys) // 4:
+            # Most of the points are candidates anyway; one pass over the arrays is cheaper
+            inside = (self.lat >= south) & (self.lat <= north) & (self.lon >= west) & (self.lon <= east)
+            return np.nonzero(inside)[0]
+        candidates = np.concatenate([self.order[a:b] for a, b in zip(lo, hi)])
+        lat, lon = self.lat[candidates], self.lon[candidates]
+        inside = (lat >= south) & (lat <= north) & (lon >= west) & (lon <= east)
+        return np.sort(candidates[inside])
+
+    def query(self, south, west, north, east):
+        """Sorted positions of points inside the box.
+
+        Longitudes come straight from Leaflet, so they may run past +/-180
+        after panning across the antimeridian; such boxes are wrapped and
+        split in two.
+        """
+        if east - west >= 360:
+            west, east = -180.0, 180.0
+        else:
+            shift = np.floor((west + 180) / 360) * 360
+            west, east = west - shift, east - shift
+        hits = self._query(south, west, north, min(east, 180.0))
+        if east > 180:
+            hits = np.union1d(hits, self._query(south, -180.0, north, east - 360))
+        return hits
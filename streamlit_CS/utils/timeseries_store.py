@@ -0,0 +1,113 @@
+"""Persistent history of live readings (weather, coin prices) in a local SQLite file.
+
+The pollers append one row per field and fetch; pages ask for a time range
+and get back at most about `points` rows per field, picked by min/max
+bucketing inside SQLite, so weeks of history chart without shipping every
+reading to the browser.
+"""
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+import streamlit as st
+
+# Runtime data, not part of the repo; see .gitignore. The LIVE_HISTORY_PATH
+# environment variable overrides it, so benchmarks can use a scratch file.
+STORE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "live", "live_history.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    series TEXT NOT NULL,
+    name TEXT NOT NULL,
+    ts REAL NOT NULL,
+    value REAL,
+    PRIMARY KEY (series, name, ts)
+) WITHOUT ROWID
+"""
+
+# Bare columns next to MIN()/MAX() come from the row holding that extreme
+# (an SQLite guarantee), so each bucket yields its lowest and highest reading
+# with their own timestamps. UNION drops the repeat when both are one row.
+BUCKET_QUERY = """
+SELECT ts, MIN(value) FROM readings
+WHERE series = :series AND name = :name AND ts BETWEEN :start AND :end
+GROUP BY MIN(CAST((ts - :start) / :width AS INTEGER), :last_bucket)
+UNION
+SELECT ts, MAX(value) FROM readings
+WHERE series = :series AND name = :name AND ts BETWEEN :start AND :end
+GROUP BY MIN(CAST((ts - :start) / :width AS INTEGER), :last_bucket)
+ORDER BY ts
+"""
+
+
+def to_epoch(time):
+    """Seconds since the epoch; naive timestamps are taken as UTC (Open-Meteo's default)."""
+    stamp = pd.Timestamp(time)
+    if stamp.tzinfo is None:
+        stamp = stamp.tz_localize("UTC")
+    return stamp.timestamp()
+
+
+class TimeSeriesStore:
+    """Append-only readings keyed by (series, name, timestamp).
+
+    Rows are clustered by that key, so a range query for one field reads
+    only its slice of the file. WAL mode lets sessions read while the
+    poller thread writes; each thread gets its own connection.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+
+    def _connect(self):
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(self.path, timeout=10)
+        return self._local.conn
+
+    def append(self, series, time, values):
+        """Store one reading: `values` maps field name to number. Repeated timestamps are ignored."""
+        ts = to_epoch(time)
+        rows = [(series, name, ts, None if pd.isna(value) else float(value)) for name, value in values.items()]
+        with self._connect() as conn:
+            conn.executemany("INSERT OR IGNORE INTO readings VALUES (?, ?, ?, ?)", rows)
+
+    def query(self, series, names, start, end, points=800):
+        """Long frame (time, name, value) for [start, end], downsampled to about `points` rows per name.
+
+        The range is split into points / 2 buckets and each keeps its
+        minimum and maximum reading, which preserves the spikes a plain
+        every-nth sample would drop.
+        """
+        start, end = to_epoch(start), to_epoch(end)
+        buckets = max(points // 2, 1)
+        width = max((end - start) / buckets, 1e-9)
+        conn = self._connect()
+        frames = []
+        for name in names:
+            rows = conn.execute(
+                BUCKET_QUERY, {"series": series, "name": name, "start": start, "end": end,
+                 "width": width, "last_bucket": buckets - 1}
+            ).fetchall()
+            frame = pd.DataFrame(rows, columns=["ts", "value"])
+            frame.insert(1, "name", name)
+            frames.append(frame)
+        result = pd.concat(frames, ignore_index=True)
+        result.insert(0, "time", pd.to_datetime(result.pop("ts"), unit="s"))
+        return result
+
+    def count(self, series):
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM readings WHERE series = ?", (series,)
+        ).fetchone()[0]
+
+
+@st.cache_resource(show_spinner=False)
+def get_store(path=None):
+    """The process-wide TimeSeriesStore at `path`, else $LIVE_HISTORY_PATH, else STORE_PATH."""
+    return TimeSeriesStore(path or os.environ.get("LIVE_HISTORY_PATH", STORE_PATH))
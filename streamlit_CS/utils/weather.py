@@ -0,0 +1,72 @@
+"""Current weather for many sites from Open-Meteo in as few requests as possible.
+
+Open-Meteo accepts comma-separated latitude/longitude lists and answers
+with one result per coordinate pair, in order. Sites are packed into
+batches of up to MAX_BATCH coordinates. When there is more than one
+batch, they are fetched concurrently, at most MAX_CONCURRENT at a time,
+so a refresh takes about as long as the slowest single request.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Open-Meteo field -> column name in the tidy frame
+CURRENT_FIELDS = {"temperature_2m": "temperature", "wind_speed_10m": "wind"}
+
+# Coordinates per request; 100 pairs keep the URL around 2 KB
+MAX_BATCH = 100
+MAX_CONCURRENT = 4
+
+COLUMNS = ["location", "latitude", "longitude", "time", *CURRENT_FIELDS.values()]
+
+
+def batch_url(batch):
+    """Forecast URL asking for the current fields at every (name, lat, lon) in `batch`."""
+    lats = ",".join(f"{lat:.4f}" for _, lat, _ in batch)
+    lons = ",".join(f"{lon:.4f}" for _, _, lon in batch)
+    return f"{FORECAST_URL}?latitude={lats}&longitude={lons}&current={','.join(CURRENT_FIELDS)}"
+
+
+def fetch_batch(client, batch):
+    """One request for a batch of sites; rows in batch order. Raises requests exceptions."""
+    resp = client.get(batch_url(batch))
+    if resp.status_code == 429:
+        retry_after = resp.headers.get("Retry-After", "a bit")
+        raise requests.HTTPError(f"429 Too Many Requests — try again after {retry_after}s", response=resp)
+    resp.raise_for_status()
+    results = resp.json()
+    if isinstance(results, dict):  # a single location comes back unwrapped
+        results = [results]
+    rows = []
+    for (name, lat, lon), result in zip(batch, results):
+        current = result["current"]
+        row = {"location": name, "latitude": lat, "longitude": lon, "time": pd.to_datetime(current["time"])}
+        for field, column in CURRENT_FIELDS.items():
+            row[column] = current.get(field)
+        rows.append(row)
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def fetch_current(sites, client, batch_size=MAX_BATCH, max_concurrent=MAX_CONCURRENT):
+    """Current weather at every site in `sites` ({name: (lat, lon)}). Returns (df, err_msg).
+
+    df has one row per location, in the order given, or is None if every
+    batch failed. A failed batch costs only its own rows; err_msg then
+    says which, and is None when all succeeded.
+    """
+    sites = [(name, lat, lon) for name, (lat, lon) in sites.items()]
+    batches = [sites[i:i + batch_size] for i in range(0, len(sites), batch_size)]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent, len(batches)))) as pool:
+        futures = [pool.submit(fetch_batch, client, batch) for batch in batches]
+    frames, errors = [], []
+    for batch, future in zip(batches, futures):
+        try:
+            frames.append(future.result())
+        except (requests.RequestException, ValueError, KeyError) as e:
+            errors.append(f"{batch[0][0]} – {batch[-1][0]}: {e}")
+    df = pd.concat(frames, ignore_index=True) if frames else None
+    err = f"Network/HTTP error for {len(errors)} of {len(batches)} batches: " + "; ".join(errors) if errors else None
+    return df, err